@@ -37,6 +37,15 @@ DEFAULT_LIMIT = 1000
 MAX_RETRIES = 5
 REQUEST_DELAY = 5  # seconds
 RATE_LIMIT_DELAY = 15  # seconds for 429 errors
+MAX_RETRY_DELAY = 300  # cap on a single exponential backoff delay, in seconds
+MAX_REQUESTS_PER_SECOND = 5  # request rate shared by all scraping threads
+REQUEST_TIMEOUT = 30  # seconds before an HTTP request is abandoned
+JOB_COUNT_CACHE_TTL = 6 * 60 * 60  # seconds to reuse fetched job counts
+MAX_CONCURRENT_REQUESTS = 5  # parallel job count requests across cities
+MAX_CONCURRENT_CITIES = 4  # cities scraped in parallel
+MAX_CONCURRENT_DETAILS = 8  # parallel job/company detail page requests per city
+HTTP_POOL_SIZE = MAX_CONCURRENT_CITIES * MAX_CONCURRENT_DETAILS  # keep-alive connections per host
+COMPANY_DETAILS_CACHE_SIZE = 4096  # company pages remembered per scraper
 
 # Dashboard configuration
 DASHBOARD_TITLE = "LinkedIn Job Trends"
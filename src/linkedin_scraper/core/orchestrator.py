@@ -2,14 +2,35 @@
 Main orchestrator for LinkedIn job scraping operations
 """
 
+import json
+import numpy as np
 import pandas as pd
-import datetime
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from config.settings import (
+    DEFAULT_CITIES,
+    DEFAULT_JOB_POSITIONS,
+    HTTP_POOL_SIZE,
+    JOB_COUNT_CACHE_TTL,
+    MAX_CONCURRENT_CITIES,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_REQUESTS_PER_SECOND,
+    MAX_RETRIES,
+    MAX_RETRY_DELAY,
+    RATE_LIMIT_DELAY,
+    REQUEST_DELAY,
+    REQUEST_TIMEOUT
+)
 
 from ..scrapers.linkedin_scraper import LinkedInScraper
 from ..scrapers.job_list_scraper import JobListScraper
+from ..utils.request_handler import RequestHandler
 from ..utils.logger import get_logger
+from ..utils.paths import ensure_dir
 
 logger = get_logger(__name__)
 
@@ -26,121 +47,299 @@ class ScrapingOrchestrator:
         Args:
             data_dir: Directory to store scraped data
         """
-        self.data_dir = data_dir or Path("data/raw/JobData")
-        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.data_dir = ensure_dir(data_dir or Path("data/raw/JobData"))
+        
+        # Share one HTTP session (and its connection pool) across all scrapers
+        self.request_handler = RequestHandler(
+            max_retries=MAX_RETRIES,
+            base_delay=REQUEST_DELAY,
+            rate_limit_delay=RATE_LIMIT_DELAY,
+            timeout=REQUEST_TIMEOUT,
+            max_delay=MAX_RETRY_DELAY,
+            pool_size=HTTP_POOL_SIZE,
+            requests_per_second=MAX_REQUESTS_PER_SECOND
+        )
         
         # Initialize scrapers
-        self.linkedin_scraper = LinkedInScraper(self.data_dir)
-        self.job_list_scraper = JobListScraper()
+        self.linkedin_scraper = LinkedInScraper(self.data_dir, self.request_handler)
+        self.job_list_scraper = JobListScraper(self.request_handler)
+        
+        # TotalJobs directories keyed by job title
+        self._total_jobs_dirs: Dict[str, Path] = {}
+        
+        # Job counts keyed by (job_title, city) -> (fetch time, counts), kept on
+        # disk so scheduled runs within the TTL reuse them across restarts
+        self._job_count_cache_file = self.data_dir / ".job_counts_cache.json"
+        self._job_count_cache: Dict[Tuple[str, str], Tuple[float, List[int]]] = self._load_job_count_cache()
+    
+    def _load_job_count_cache(self) -> Dict[Tuple[str, str], Tuple[float, List[int]]]:
+        """
+        Load the persisted job count cache, dropping expired entries.
+        
+        Returns:
+            Dictionary of cached job counts
+        """
+        if not self._job_count_cache_file.exists():
+            return {}
+        
+        try:
+            entries = json.loads(self._job_count_cache_file.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read job count cache: {e}")
+            return {}
+        
+        now = time.time()
+        return {
+            (entry['job_title'], entry['city']): (entry['fetched_at'], entry['counts'])
+            for entry in entries
+            if now - entry['fetched_at'] < JOB_COUNT_CACHE_TTL
+        }
+    
+    def _save_job_count_cache(self) -> None:
+        """Persist the job count cache to disk."""
+        entries = [
+            {'job_title': job_title, 'city': city, 'fetched_at': fetched_at, 'counts': counts}
+            for (job_title, city), (fetched_at, counts) in self._job_count_cache.items()
+        ]
+        
+        try:
+            self._job_count_cache_file.write_text(json.dumps(entries))
+        except OSError as e:
+            logger.warning(f"Could not write job count cache: {e}")
+    
+    def _total_jobs_dir(self, job_title: str) -> Path:
+        """
+        Get (and create on first use) the TotalJobs directory for a job title.
+        
+        Args:
+            job_title: Job title the history belongs to
+        
+        Returns:
+            Directory holding the TotalJobs history
+        """
+        job_data_dir = self._total_jobs_dirs.get(job_title)
+        
+        if job_data_dir is None:
+            job_data_dir = ensure_dir(self.data_dir / job_title / "TotalJobs")
+            self._total_jobs_dirs[job_title] = job_data_dir
+        
+        return job_data_dir
+    
+    def _get_total_jobs(self, job_title: str, city: str) -> List[Optional[int]]:
+        """
+        Get job counts for a city, reusing counts fetched within the cache TTL.
+        
+        Args:
+            job_title: Job title to search for
+            city: City to get job counts for
+        
+        Returns:
+            List of job counts [total, past_month, past_week, past_24h]
+        """
+        cached = self._job_count_cache.get((job_title, city))
+        if cached is not None and time.time() - cached[0] < JOB_COUNT_CACHE_TTL:
+            logger.info(f"Using cached job counts for {city}")
+            return cached[1]
+        
+        logger.info(f"Getting job counts for {city}")
+        result = self.job_list_scraper.get_total_jobs(job_title, city)
+        
+        if None not in result:
+            self._job_count_cache[(job_title, city)] = (time.time(), result)
+        
+        return result
     
-    def create_city_comparison(self, job_title: str, cities: List[str] = None) -> Optional[pd.DataFrame]:
+    def create_city_comparison(self, job_title: str, cities: List[str] = None,
+                               max_concurrency: int = MAX_CONCURRENT_REQUESTS) -> Optional[pd.DataFrame]:
         """
         Create a comparison of job counts across cities.
         
         Args:
             job_title: Job title to search for
             cities: List of cities to compare (optional)
+            max_concurrency: Maximum number of cities fetched in parallel
         
         Returns:
             DataFrame with city comparison data
         """
         if cities is None:
-            from ...config.settings import DEFAULT_CITIES
             cities = DEFAULT_CITIES
         
         logger.info(f"Creating city comparison for '{job_title}' across {len(cities)} cities")
         
-        # Create directory structure
-        job_data_dir = self.data_dir / f"{job_title}/TotalJobs"
-        job_data_dir.mkdir(parents=True, exist_ok=True)
+        # Get job counts for each city, overlapping the network round-trips
+        with ThreadPoolExecutor(max_workers=max(1, min(len(cities), max_concurrency))) as executor:
+            results = list(executor.map(lambda city: self._get_total_jobs(job_title, city), cities))
         
-        # Initialize DataFrame
-        df = pd.DataFrame(columns=['City', '24h_Jobs', 'Week_Jobs', 'Month_Jobs', 'Total_Jobs', 'Date'])
-        total_jobs = []
+        self._save_job_count_cache()
         
-        # Get job counts for each city
-        for city in cities:
-            logger.info(f"Getting job counts for {city}")
-            
-            result = self.job_list_scraper.get_total_jobs(job_title, city)
-            
-            if result == [None, None, None, None]:
+        # Keep the cities that succeeded; one failed fetch should not discard the rest
+        fetched_cities = []
+        fetched_counts = []
+        failed_cities = []
+        for city, result in zip(cities, results):
+            if result is None or any(x is None for x in result):
                 logger.error(f"Failed to get job counts for {city}")
-                return None
-            
-            total_jobs.append(result)
+                failed_cities.append(city)
+            else:
+                fetched_cities.append(city)
+                fetched_counts.append(result)
         
-        logger.info(f"Job counts collected: {total_jobs}")
+        if not fetched_cities:
+            logger.error("Failed to get job counts for all cities")
+            return None
         
-        # Populate DataFrame
-        df["City"] = cities
-        df["24h_Jobs"] = [x[3] for x in total_jobs]  # Past 24 hours
-        df["Week_Jobs"] = [x[2] for x in total_jobs]  # Past week
-        df["Month_Jobs"] = [x[1] for x in total_jobs]  # Past month
-        df["Total_Jobs"] = [x[0] for x in total_jobs]  # Total
-        df['Date'] = datetime.datetime.now().strftime('%Y-%m-%d')
+        if failed_cities:
+            logger.warning(f"Skipping cities without job counts: {failed_cities}")
         
-        # Try to append to existing data
-        total_jobs_file = job_data_dir / "TotalJobs.csv"
+        # Rows of [total, past_month, past_week, past_24h] counts per city
+        total_jobs = np.array(fetched_counts, dtype=np.int64)
         
-        try:
-            if total_jobs_file.exists():
-                existing_df = pd.read_csv(total_jobs_file)
-                df = pd.concat([existing_df, df], ignore_index=True)
-        except Exception as e:
-            logger.warning(f"Could not read existing TotalJobs.csv: {e}")
+        logger.info(f"Job counts collected: {total_jobs.tolist()}")
+        
+        # Native datetime64 date; it is still written to CSV as YYYY-MM-DD
+        today = pd.Timestamp.today().normalize()
         
-        # Sort by date and save
-        df = df.sort_values(by='Date')
-        df.to_csv(total_jobs_file, index=False)
+        df = pd.DataFrame({
+            'City': fetched_cities,
+            '24h_Jobs': total_jobs[:, 3],
+            'Week_Jobs': total_jobs[:, 2],
+            'Month_Jobs': total_jobs[:, 1],
+            'Total_Jobs': total_jobs[:, 0],
+            'Date': today
+        })
+        
+        total_jobs_file = self._save_total_jobs(df, self._total_jobs_dir(job_title))
         
         logger.info(f"City comparison data saved to {total_jobs_file}")
         return df
     
-    def scrape_city_data(self, job_title: str, cities: List[str] = None) -> None:
+    def _save_total_jobs(self, df: pd.DataFrame, job_data_dir: Path) -> Path:
+        """
+        Append a batch of city job counts to the TotalJobs history.
+        
+        The history stays in CSV: it is the format the dashboard reads and the
+        one existing deployments have accumulated their history in. Only the new
+        rows are written; readers sort by date themselves.
+        
+        Args:
+            df: New city comparison rows
+            job_data_dir: Directory holding the TotalJobs history
+        
+        Returns:
+            Path to the TotalJobs history file
+        """
+        total_jobs_file = job_data_dir / "TotalJobs.csv"
+        write_header = not total_jobs_file.exists()
+        
+        # Match the column order of the existing history
+        if not write_header:
+            try:
+                existing_columns = pd.read_csv(total_jobs_file, nrows=0).columns
+                df = df.reindex(columns=existing_columns)
+            except Exception as e:
+                logger.warning(f"Could not read existing TotalJobs.csv header: {e}")
+        
+        # Write through a single 1 MiB buffered handle; it is flushed once on close
+        with open(total_jobs_file, 'a', buffering=1 << 20, newline='') as fh:
+            df.to_csv(fh, header=write_header, index=False)
+        
+        return total_jobs_file
+    
+    def scrape_city_data(self, job_title: str, cities: List[str] = None,
+                         max_workers: int = MAX_CONCURRENT_CITIES) -> None:
         """
         Scrape detailed job data for all cities.
         
+        Cities are independent, so they are scraped concurrently. The scrapers
+        only share the underlying HTTP session and write to per-city files.
+        
         Args:
             job_title: Job title to search for
             cities: List of cities to scrape (optional)
+            max_workers: Maximum number of cities scraped in parallel
         """
         if cities is None:
-            from ...config.settings import DEFAULT_CITIES
             cities = DEFAULT_CITIES
         
         logger.info(f"Starting detailed data scraping for '{job_title}' across {len(cities)} cities")
         
-        for city in cities:
-            logger.info(f"Scraping data for {city}")
+        failed_cities = []
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(len(cities), max_workers))) as executor:
+            futures = {executor.submit(self._scrape_one_city, job_title, city): city for city in cities}
             
+            for future in as_completed(futures):
+                city = futures[future]
+                try:
+                    if not future.result():
+                        failed_cities.append(city)
+                except Exception:
+                    # One city's unexpected error must not abort the others
+                    logger.exception(f"Unexpected error scraping data for {city}")
+                    failed_cities.append(city)
+        
+        if not failed_cities:
+            return
+        
+        # Give transient failures (rate limits, dropped connections) one more pass
+        retry_delay = REQUEST_DELAY * 2
+        logger.warning(f"Retrying {len(failed_cities)} failed cities in {retry_delay} seconds: {failed_cities}")
+        time.sleep(retry_delay)
+        
+        still_failed = []
+        for city in failed_cities:
             try:
-                # Scrape job listings
-                jobs_df, jobs_path = self.linkedin_scraper.scrape_all_jobs(job_title, city, limit=100)
-                
-                if jobs_df is None:
-                    logger.error(f"Failed to scrape jobs for {city}")
-                    continue
-                
-                # Scrape job details
-                details_df, details_path = self.linkedin_scraper.scrape_all_job_details(jobs_path)
-                
-                if details_df is None:
-                    logger.error(f"Failed to scrape job details for {city}")
-                    continue
-                
-                # Scrape company details
-                company_df, final_path = self.linkedin_scraper.scrape_all_company_details(details_path)
-                
-                if company_df is None:
-                    logger.error(f"Failed to scrape company details for {city}")
-                    continue
-                
-                logger.info(f"Successfully scraped complete data for {city}")
-                
-            except Exception as e:
-                logger.error(f"Error scraping data for {city}: {e}")
-                continue
+                if not self._scrape_one_city(job_title, city):
+                    still_failed.append(city)
+            except Exception:
+                logger.exception(f"Unexpected error scraping data for {city}")
+                still_failed.append(city)
+        
+        if still_failed:
+            logger.error(f"Failed to scrape data for cities: {still_failed}")
+    
+    def _scrape_one_city(self, job_title: str, city: str) -> bool:
+        """
+        Run the job list, job details and company details scraping for one city.
+        
+        Args:
+            job_title: Job title to search for
+            city: City to scrape
+        
+        Returns:
+            True if the complete data was scraped, False otherwise
+        """
+        logger.info(f"Scraping data for {city}")
+        
+        try:
+            # Scrape job listings
+            jobs_df, jobs_path = self.linkedin_scraper.scrape_all_jobs(job_title, city, limit=100)
+            
+            if jobs_df is None:
+                logger.error(f"Failed to scrape jobs for {city}")
+                return False
+            
+            # Scrape job details, handing over the listings instead of re-reading them
+            details_df, details_path = self.linkedin_scraper.scrape_all_job_details(jobs_path, jobs_df)
+            
+            if details_df is None:
+                logger.error(f"Failed to scrape job details for {city}")
+                return False
+            
+            # Scrape company details
+            company_df, final_path = self.linkedin_scraper.scrape_all_company_details(details_path, details_df)
+            
+            if company_df is None:
+                logger.error(f"Failed to scrape company details for {city}")
+                return False
+            
+            logger.info(f"Successfully scraped complete data for {city}")
+            return True
+            
+        except (requests.RequestException, ValueError, KeyError, OSError):
+            logger.exception(f"Error scraping data for {city}")
+            return False
     
     def run_complete_workflow(self, job_titles: List[str] = None, cities: List[str] = None) -> None:
         """
@@ -151,7 +350,6 @@ class ScrapingOrchestrator:
             cities: List of cities to scrape (optional)
         """
         if job_titles is None:
-            from ...config.settings import DEFAULT_JOB_POSITIONS
             job_titles = DEFAULT_JOB_POSITIONS
         
         logger.info(f"Starting complete workflow for {len(job_titles)} job titles")
@@ -8,6 +8,7 @@ import pandas as pd
 import os
 import sys
 from pathlib import Path
+from typing import Dict, Optional
 import plotly.graph_objects as go
 
 # Add project root to path for config import
@@ -15,25 +16,94 @@ project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from .dashboard_functions import (
+    downsample_lttb,
     find_number_jobs_per_city,
     find_latest_jobs_cities,
     get_available_reports,
-    get_city_data_summary
+    get_city_data_summary,
+    load_jobs_table
 )
+from ..utils.logger import get_logger
+from ..utils.paths import city_jobs_path
 from config.settings import DEFAULT_CITIES, DASHBOARD_TITLE, DASHBOARD_LAYOUT
 
+logger = get_logger(__name__)
 
-def setup_page_config():
-    """Set up Streamlit page configuration."""
-    st.set_page_config(
-        page_title=DASHBOARD_TITLE,
-        layout=DASHBOARD_LAYOUT,
-        initial_sidebar_state="expanded",
-        page_icon="📊"
-    )
-    
-    # Enhanced CSS with cooler visuals and animations
-    st.markdown("""
+# Columns of the per-city job CSV used by the breakdown charts
+BREAKDOWN_COLUMNS = ['seniority_level', 'employment_type', 'industries', 'company_size']
+
+# LinkedIn company size ranges grouped into the buckets shown on the dashboard,
+# kept as a Series so the categorical remap is a single hash join
+COMPANY_SIZE_MAPPING = pd.Series({
+    '1-10 employees': 'Small (less than 50)',
+    '11-50 employees': 'Small (less than 50)',
+    '51-200 employees': 'Medium (50-200)',
+    '201-500 employees': 'Medium (50-200)',
+    '501-1,000 employees': 'Large (500-5000)',
+    '1,001-5,000 employees': 'Large (500-5000)',
+    '5,001-10,000 employees': 'Very Large (5000+)',
+    '10,001+ employees': 'Very Large (5000+)'
+})
+COMPANY_SIZE_ORDER = ['Small (less than 50)', 'Medium (50-200)', 'Large (500-5000)', 'Very Large (5000+)']
+
+# Pie chart colors per category
+_SENIORITY_COLORS = {
+    'Entry level': 'blue',
+    'Mid-Senior level': 'green',
+    'Director': 'red',
+    'Executive': 'purple',
+    'Internship': 'orange'
+}
+_EMPLOYMENT_COLORS = {
+    'Full-time': 'blue',
+    'Part-time': 'green',
+    'Contract': 'red',
+    'Temporary': 'purple',
+    'Volunteer': 'orange',
+    'Internship': 'pink'
+}
+_COMPANY_SIZE_COLORS = {
+    'Small (less than 50)': 'lightblue',
+    'Medium (50-200)': 'green',
+    'Large (500-5000)': 'red',
+    'Very Large (5000+)': 'purple'
+}
+
+# Upper bound on points sent to the browser for the trends line
+TRENDS_MAX_POINTS = 800
+
+
+# Layout and trace styling shared by all breakdown pie charts
+_PIE_LAYOUT = dict(
+    font=dict(size=14, family="Inter, sans-serif"),
+    legend=dict(
+        orientation="v",
+        yanchor="middle",
+        y=0.5,
+        xanchor="left",
+        x=1.02,
+        bgcolor='rgba(255,255,255,0.8)',
+        bordercolor='rgba(102,126,234,0.3)',
+        borderwidth=1
+    ),
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    transition=dict(duration=0)
+)
+_PIE_TRACES = dict(
+    textposition='inside',
+    textinfo='percent+label',
+    textfont_size=12,
+    marker=dict(line=dict(color='#FFFFFF', width=2))
+)
+
+# Plotly client configs: the pies are read-only, the trends chart keeps zoom/pan
+_PIE_CHART_CONFIG = {'displayModeBar': False, 'staticPlot': False}
+_TRENDS_CHART_CONFIG = {'displaylogo': False, 'modeBarButtonsToRemove': ['lasso2d', 'select2d']}
+
+# Static page styling, built once at import and re-sent on every rerun (Streamlit
+# drops elements a rerun does not emit, so it cannot be injected only once)
+_DASHBOARD_CSS = """
     <style>
     /* Import Google Fonts */
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
@@ -257,7 +327,153 @@ def setup_page_config():
         box-shadow: 0 10px 25px rgba(0, 184, 148, 0.3);
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+# Summary banner shown under the page header
+_INFO_BANNER_TEMPLATE = """
+    <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+                padding: 2rem; border-radius: 15px; margin: 2rem 0; 
+                box-shadow: 0 10px 30px rgba(0,0,0,0.2);">
+        <div style="display: flex; justify-content: space-around; text-align: center;">
+            <div style="color: white;">
+                <h3 style="margin: 0; font-size: 1.2rem; opacity: 0.9;">📍 City</h3>
+                <h2 style="margin: 0.5rem 0 0 0; font-size: 1.8rem; font-weight: 700;">{selected_city}</h2>
+            </div>
+            <div style="color: white;">
+                <h3 style="margin: 0; font-size: 1.2rem; opacity: 0.9;">💼 Position</h3>
+                <h2 style="margin: 0.5rem 0 0 0; font-size: 1.8rem; font-weight: 700;">{selected_report}</h2>
+            </div>
+            <div style="color: white;">
+                <h3 style="margin: 0; font-size: 1.2rem; opacity: 0.9;">📊 Analysis</h3>
+                <h2 style="margin: 0.5rem 0 0 0; font-size: 1.8rem; font-weight: 700;">Total Jobs</h2>
+            </div>
+        </div>
+    </div>
+    """
+
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=64)
+def compute_breakdowns(selected_report: str, selected_city: str, data_dir_str: str, mtime: float) -> Dict[str, pd.Series]:
+    """
+    Compute the value counts of every breakdown column of a city's job CSV.
+    
+    The breakdown columns are read once, from the Parquet copy of the CSV
+    when available, as categoricals, and the counts for all breakdown charts
+    are returned together. Passing the file modification time
+    invalidates the cache when the scraper rewrites the file.
+    
+    Args:
+        selected_report: Selected job report
+        selected_city: Selected city
+        data_dir_str: Directory containing the data
+        mtime: Modification time of the CSV file
+        
+    Returns:
+        Dictionary mapping each available breakdown column to its value counts
+    """
+    csv_path = city_jobs_path(Path(data_dir_str), selected_report, selected_city)
+    df = load_jobs_table(csv_path, BREAKDOWN_COLUMNS).astype('category')
+    
+    # Industries are unsorted; the chart picks its top entries with nlargest
+    breakdowns = {
+        column: df[column].value_counts(sort=column != 'industries')
+        for column in df.columns if column != 'company_size'
+    }
+    
+    if 'company_size' in df.columns:
+        # Remap the raw ranges into ordered size buckets in one vectorized pass
+        size_dtype = pd.CategoricalDtype(COMPANY_SIZE_ORDER, ordered=True)
+        mapped = df['company_size'].map(COMPANY_SIZE_MAPPING).astype(size_dtype)
+        breakdowns['company_size'] = mapped.value_counts().reindex(COMPANY_SIZE_ORDER, fill_value=0)
+    
+    return breakdowns
+
+
+def _file_mtime(path: Path) -> float:
+    """
+    Get the modification time of a file, or 0.0 if it does not exist.
+    
+    Args:
+        path: File path
+        
+    Returns:
+        Modification time in seconds
+    """
+    return path.stat().st_mtime if path.exists() else 0.0
+
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=32)
+def load_dashboard_bundle(selected_report: str, selected_city: str, data_dir_str: str, mtimes: tuple) -> Dict:
+    """
+    Load everything the dashboard renders for a report and city in one pass.
+    
+    Passing the modification times of the source files invalidates the cache
+    when the scraper rewrites them.
+    
+    Args:
+        selected_report: Selected job report
+        selected_city: Selected city
+        data_dir_str: Directory containing the data
+        mtimes: Modification times of the TotalJobs CSV and the city CSV
+        
+    Returns:
+        Dictionary with 'trends' and 'latest' (DataFrames of total job counts) and
+        'breakdowns' (value counts per column); each is None if unavailable
+    """
+    data_dir = Path(data_dir_str)
+    totals_mtime, city_mtime = mtimes
+    bundle = {'trends': None, 'latest': None, 'breakdowns': None}
+    
+    if totals_mtime:
+        try:
+            bundle['trends'] = downsample_lttb(
+                find_number_jobs_per_city(selected_report, selected_city, "Total", data_dir),
+                'Date', 'Total_Jobs', n_out=TRENDS_MAX_POINTS
+            )
+            bundle['latest'] = find_latest_jobs_cities(selected_report, "Total", data_dir)
+        except Exception as e:
+            logger.error(f"Error loading job counts for {selected_report}: {e}")
+    
+    if city_mtime:
+        try:
+            bundle['breakdowns'] = compute_breakdowns(selected_report, selected_city, data_dir_str, city_mtime)
+        except Exception as e:
+            logger.error(f"Error loading breakdowns for {selected_report} in {selected_city}: {e}")
+    
+    return bundle
+
+
+def load_dashboard_data(selected_report: str, selected_city: str, data_dir: Path) -> Dict:
+    """
+    Get the cached dashboard bundle for the current files on disk.
+    
+    Args:
+        selected_report: Selected job report
+        selected_city: Selected city
+        data_dir: Directory containing the data
+        
+    Returns:
+        Dashboard bundle, see load_dashboard_bundle
+    """
+    mtimes = (
+        _file_mtime(data_dir / f"{selected_report}/TotalJobs/TotalJobs.csv"),
+        _file_mtime(city_jobs_path(data_dir, selected_report, selected_city))
+    )
+    
+    return load_dashboard_bundle(selected_report, selected_city, str(data_dir), mtimes)
+
+
+def setup_page_config():
+    """Set up Streamlit page configuration."""
+    st.set_page_config(
+        page_title=DASHBOARD_TITLE,
+        layout=DASHBOARD_LAYOUT,
+        initial_sidebar_state="expanded",
+        page_icon="📊"
+    )
+    
+    # Enhanced CSS with cooler visuals and animations
+    st.markdown(_DASHBOARD_CSS, unsafe_allow_html=True)
 
 
 def create_sidebar(data_dir: Path) -> tuple:
@@ -322,36 +538,34 @@ def create_sidebar(data_dir: Path) -> tuple:
     return selected_city, selected_report
 
 
-def create_job_trends_chart(selected_report: str, selected_city: str, job_date: str, data_dir: Path):
+def create_job_trends_chart(selected_report: str, selected_city: str, df: Optional[pd.DataFrame]):
     """
     Create the main job trends chart.
     
     Args:
         selected_report: Selected job report
         selected_city: Selected city
-        job_date: Selected time period
-        data_dir: Directory containing the data
+        df: Job counts over time for the selected period, or None if no data
     """
     with st.spinner('Loading job trends data...'):
         try:
-            df = find_number_jobs_per_city(selected_report, selected_city, job_date, data_dir)
+            if df is None:
+                st.warning(f"No job count history available for {selected_report}")
+                return
             
-            fig = px.line(
-                df, 
-                title='Evolution of Jobs in ' + selected_city + ' over Time',
-                x='Date',
-                y='Total_Jobs',
-                labels={'Date': 'Date', 'Total_Jobs': 'Total Jobs'},
-                line_shape='spline',
-                hover_data={'Date': '|%B %d, %Y'}
-            )
+            fig = go.Figure(go.Scatter(
+                x=df['Date'],
+                y=df['Total_Jobs'],
+                mode='lines+markers' if len(df) <= 500 else 'lines',
+                line=dict(width=3, shape='spline'),
+                hovertemplate='<b>Date: %{x|%b %d, %Y}</b><br><b>Total Jobs: %{y}</b><extra></extra>',
+                showlegend=False
+            ))
             
-            fig.update_traces(
-                hovertemplate='<b>Date: %{x}</b><br><b>Total Jobs: %{y}</b><extra></extra>',
-                textfont_size=20,
-                mode='lines+markers',
-                line=dict(width=3),
-                marker=dict()
+            fig.update_layout(
+                title='Evolution of Jobs in ' + selected_city + ' over Time',
+                xaxis_title='Date',
+                yaxis_title='Total Jobs'
             )
             
             fig.update_xaxes(
@@ -389,340 +603,211 @@ def create_job_trends_chart(selected_report: str, selected_city: str, job_date:
                 )
             )
             
-            st.plotly_chart(fig)
+            st.plotly_chart(fig, config=_TRENDS_CHART_CONFIG)
         
         except Exception as e:
             st.error(f"Error creating trends chart: {e}")
 
 
-def create_city_metrics(selected_report: str, job_date: str, data_dir: Path):
+def create_city_metrics(selected_report: str, df: Optional[pd.DataFrame]):
     """
     Create city metrics display.
     
     Args:
         selected_report: Selected job report
-        job_date: Selected time period
-        data_dir: Directory containing the data
+        df: Latest job counts and deltas per city, or None if no data
     """
     try:
-        df = find_latest_jobs_cities(selected_report, job_date, data_dir)
-        
-        # Split DataFrame into groups for display
-        df1 = df.iloc[:2]
-        df2 = df.iloc[2:4]
-        df3 = df.iloc[4:6]
+        if df is None:
+            st.warning(f"No city metrics available for {selected_report}")
+            return
         
-        col21, col22, col23, col24 = st.columns([0.5, 1, 1, 1])
+        df = df.head(6)
         
-        with col22:
-            st.markdown('#')
-            for _, row in df1.iterrows():
-                st.metric(label=row['City'], value=row['Total_Jobs'], delta=row['delta'])
+        # Two cities per column; tolist() yields plain Python scalars for st.metric
+        rows = zip(df['City'].tolist(), df['Total_Jobs'].tolist(), df['delta'].tolist())
+        cols = st.columns([0.5, 1, 1, 1])[1:]
         
-        with col23:
-            st.markdown('#')
-            for _, row in df2.iterrows():
-                st.metric(label=row['City'], value=row['Total_Jobs'], delta=row['delta'])
+        for col in cols:
+            with col:
+                st.markdown('#')
         
-        with col24:
-            st.markdown('#')
-            for _, row in df3.iterrows():
-                st.metric(label=row['City'], value=row['Total_Jobs'], delta=row['delta'])
+        for i, (city, total_jobs, delta) in enumerate(rows):
+            with cols[i // 2]:
+                st.metric(label=city, value=total_jobs, delta=delta)
                 
     except Exception as e:
         st.error(f"Error creating city metrics: {e}")
 
 
-def create_seniority_chart(selected_report: str, selected_city: str, data_dir: Path):
+def create_trends_section(selected_report: str, selected_city: str, bundle: Dict):
+    """
+    Create the job trends chart and city metrics.
+    
+    Args:
+        selected_report: Selected job report
+        selected_city: Selected city
+        bundle: Dashboard data from load_dashboard_bundle
+    """
+    col1, col2 = st.columns([3, 1])
+    
+    with col1:
+        with st.container():
+            create_job_trends_chart(selected_report, selected_city, bundle['trends'])
+    
+    with col2:
+        st.markdown("""
+        <div style="text-align: center; margin-bottom: 1rem;">
+            <h4 style="color: #0077b5; margin: 0;">🏙️ City Metrics</h4>
+        </div>
+        """, unsafe_allow_html=True)
+        create_city_metrics(selected_report, bundle['latest'])
+
+
+def build_pie_figure(series: pd.Series, color_map: Optional[Dict[str, str]] = None) -> go.Figure:
+    """
+    Build a styled donut chart from a value counts series.
+    
+    Args:
+        series: Counts indexed by category
+        color_map: Optional mapping of category to color
+        
+    Returns:
+        Plotly figure
+    """
+    if color_map is None:
+        fig = px.pie(series, values=series.values, names=series.index, hole=0.4)
+    else:
+        fig = px.pie(
+            series,
+            values=series.values,
+            names=series.index,
+            color=series.index,
+            color_discrete_map=color_map,
+            hole=0.4
+        )
+    
+    fig.update_layout(**_PIE_LAYOUT)
+    fig.update_traces(**_PIE_TRACES)
+    
+    return fig
+
+
+def create_seniority_chart(selected_report: str, selected_city: str, breakdowns: Optional[Dict[str, pd.Series]]):
     """
     Create seniority level pie chart.
     
     Args:
         selected_report: Selected job report
         selected_city: Selected city
-        data_dir: Directory containing the data
+        breakdowns: Value counts per breakdown column, or None if no data
     """
     try:
-        csv_path = data_dir / f"{selected_report}/{selected_report} in {selected_city}.csv"
-        print(csv_path)
-        
-        if not csv_path.exists():
+        if breakdowns is None:
             st.warning(f"No data available for {selected_report} in {selected_city}")
             return
         
-        df = pd.read_csv(csv_path)
-        print("df")
-        print(df)
-        
-        if 'seniority_level' not in df.columns:
+        if 'seniority_level' not in breakdowns:
             st.warning("Seniority level data not available")
             return
         
-        seniority_level = df['seniority_level'].value_counts()
+        seniority_level = breakdowns['seniority_level']
         
-        color_discrete_map = {
-            'Entry level': 'blue',
-            'Mid-Senior level': 'green',
-            'Director': 'red',
-            'Executive': 'purple',
-            'Internship': 'orange'
-        }
+        fig = build_pie_figure(seniority_level, _SENIORITY_COLORS)
         
-        fig = px.pie(
-            seniority_level, 
-            values=seniority_level.values, 
-            names=seniority_level.index, 
-            color=seniority_level.index, 
-            color_discrete_map=color_discrete_map,
-            hole=0.4
-        )
-        
-        fig.update_layout(
-            font=dict(size=14, family="Inter, sans-serif"),
-            legend=dict(
-                orientation="v",
-                yanchor="middle",
-                y=0.5,
-                xanchor="left",
-                x=1.02,
-                bgcolor='rgba(255,255,255,0.8)',
-                bordercolor='rgba(102,126,234,0.3)',
-                borderwidth=1
-            ),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
-        )
-        
-        fig.update_traces(
-            textposition='inside',
-            textinfo='percent+label',
-            textfont_size=12,
-            marker=dict(line=dict(color='#FFFFFF', width=2))
-        )
-        
-        st.plotly_chart(fig)
+        st.plotly_chart(fig, config=_PIE_CHART_CONFIG)
         
     except Exception as e:
         st.error(f"Error creating seniority chart: {e}")
 
 
-def create_employment_type_chart(selected_report: str, selected_city: str, data_dir: Path):
+def create_employment_type_chart(selected_report: str, selected_city: str, breakdowns: Optional[Dict[str, pd.Series]]):
     """
     Create employment type pie chart.
     
     Args:
         selected_report: Selected job report
         selected_city: Selected city
-        data_dir: Directory containing the data
+        breakdowns: Value counts per breakdown column, or None if no data
     """
     try:
-        csv_path = data_dir / f"{selected_report}/{selected_report} in {selected_city}.csv"
-        
-        if not csv_path.exists():
+        if breakdowns is None:
             st.warning(f"No data available for {selected_report} in {selected_city}")
             return
         
-        df = pd.read_csv(csv_path)
-        
-        if 'employment_type' not in df.columns:
+        if 'employment_type' not in breakdowns:
             st.warning("Employment type data not available")
             return
         
-        employment_type = df['employment_type'].value_counts()
-        
-        color_discrete_map = {
-            'Full-time': 'blue',
-            'Part-time': 'green',
-            'Contract': 'red',
-            'Temporary': 'purple',
-            'Volunteer': 'orange',
-            'Internship': 'pink'
-        }
-        
-        fig = px.pie(
-            employment_type, 
-            values=employment_type.values, 
-            names=employment_type.index, 
-            color=employment_type.index, 
-            color_discrete_map=color_discrete_map,
-            hole=0.4
-        )
+        employment_type = breakdowns['employment_type']
         
-        fig.update_layout(
-            font=dict(size=14, family="Inter, sans-serif"),
-            legend=dict(
-                orientation="v",
-                yanchor="middle",
-                y=0.5,
-                xanchor="left",
-                x=1.02,
-                bgcolor='rgba(255,255,255,0.8)',
-                bordercolor='rgba(102,126,234,0.3)',
-                borderwidth=1
-            ),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
-        )
+        fig = build_pie_figure(employment_type, _EMPLOYMENT_COLORS)
         
-        fig.update_traces(
-            textposition='inside',
-            textinfo='percent+label',
-            textfont_size=12,
-            marker=dict(line=dict(color='#FFFFFF', width=2))
-        )
-        
-        st.plotly_chart(fig)
+        st.plotly_chart(fig, config=_PIE_CHART_CONFIG)
         
     except Exception as e:
         st.error(f"Error creating employment type chart: {e}")
 
 
-def create_industries_chart(selected_report: str, selected_city: str, data_dir: Path):
+def create_industries_chart(selected_report: str, selected_city: str, breakdowns: Optional[Dict[str, pd.Series]]):
     """
     Create industries pie chart.
     
     Args:
         selected_report: Selected job report
         selected_city: Selected city
-        data_dir: Directory containing the data
+        breakdowns: Value counts per breakdown column, or None if no data
     """
     try:
-        csv_path = data_dir / f"{selected_report}/{selected_report} in {selected_city}.csv"
-        
-        if not csv_path.exists():
+        if breakdowns is None:
             st.warning(f"No data available for {selected_report} in {selected_city}")
             return
         
-        df = pd.read_csv(csv_path)
-        
-        if 'industries' not in df.columns:
+        if 'industries' not in breakdowns:
             st.warning("Industries data not available")
             return
         
-        industries = df['industries'].value_counts()
-        
-        # Keep only top 10 industries, combine rest into 'Other'
-        if len(industries) > 10:
-            top_10 = industries.head(5)
-            others_sum = industries.iloc[5:].sum()
-            top_10['Other'] = others_sum
-            industries = top_10
-        
-        fig = px.pie(industries, values=industries.values, names=industries.index, hole=0.4)
-        
-        fig.update_layout(
-            font=dict(size=14, family="Inter, sans-serif"),
-            legend=dict(
-                orientation="v",
-                yanchor="middle",
-                y=0.5,
-                xanchor="left",
-                x=1.02,
-                bgcolor='rgba(255,255,255,0.8)',
-                bordercolor='rgba(102,126,234,0.3)',
-                borderwidth=1
-            ),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
-        )
+        counts = breakdowns['industries']
         
-        fig.update_traces(
-            textposition='inside',
-            textinfo='percent+label',
-            textfont_size=12,
-            marker=dict(line=dict(color='#FFFFFF', width=2))
-        )
+        # Keep the top 5 industries and fold the rest into 'Other'
+        industries = counts.nlargest(5)
+        others_sum = counts.sum() - industries.sum()
+        if others_sum > 0:
+            industries = industries.copy()
+            industries['Other'] = others_sum
         
-        st.plotly_chart(fig)
+        fig = build_pie_figure(industries)
+        
+        st.plotly_chart(fig, config=_PIE_CHART_CONFIG)
         
     except Exception as e:
         st.error(f"Error creating industries chart: {e}")
 
 
-def create_company_size_chart(selected_report: str, selected_city: str, data_dir: Path):
+def create_company_size_chart(selected_report: str, selected_city: str, breakdowns: Optional[Dict[str, pd.Series]]):
     """
     Create company size pie chart.
     
     Args:
         selected_report: Selected job report
         selected_city: Selected city
-        data_dir: Directory containing the data
+        breakdowns: Value counts per breakdown column, or None if no data
     """
     try:
-        csv_path = data_dir / f"{selected_report}/{selected_report} in {selected_city}.csv"
-        
-        if not csv_path.exists():
+        if breakdowns is None:
             st.warning(f"No data available for {selected_report} in {selected_city}")
             return
         
-        df = pd.read_csv(csv_path)
-        
-        if 'company_size' not in df.columns:
+        if 'company_size' not in breakdowns:
             st.warning("Company size data not available")
             return
         
-        company_size = df['company_size'].value_counts()
-        
-        # Define size mapping
-        size_mapping = {
-            '1-10 employees': 'Small (less than 50)',
-            '11-50 employees': 'Small (less than 50)',
-            '51-200 employees': 'Medium (50-200)',
-            '201-500 employees': 'Medium (50-200)',
-            '501-1,000 employees': 'Large (500-5000)',
-            '1,001-5,000 employees': 'Large (500-5000)',
-            '5,001-10,000 employees': 'Very Large (5000+)',
-            '10,001+ employees': 'Very Large (5000+)'
-        }
-        
-        # Map company sizes to larger categories
-        company_size = company_size.groupby(size_mapping).sum()
-        
-        # Ensure proper order
-        size_order = ['Small (less than 50)', 'Medium (50-200)', 'Large (500-5000)', 'Very Large (5000+)']
-        company_size.index = pd.Categorical(company_size.index, categories=size_order, ordered=True)
-        company_size = company_size.sort_index()
-        
-        color_discrete_map = {
-            'Small (less than 50)': 'lightblue',
-            'Medium (50-200)': 'green',
-            'Large (500-5000)': 'red',
-            'Very Large (5000+)': 'purple'
-        }
-        
-        fig = px.pie(
-            company_size, 
-            values=company_size.values, 
-            names=company_size.index, 
-            color=company_size.index, 
-            color_discrete_map=color_discrete_map,
-            hole=0.4
-        )
-        
-        fig.update_layout(
-            font=dict(size=14, family="Inter, sans-serif"),
-            legend=dict(
-                orientation="v",
-                yanchor="middle",
-                y=0.5,
-                xanchor="left",
-                x=1.02,
-                bgcolor='rgba(255,255,255,0.8)',
-                bordercolor='rgba(102,126,234,0.3)',
-                borderwidth=1
-            ),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
-        )
+        # Already bucketed and ordered by compute_breakdowns
+        company_size = breakdowns['company_size']
         
-        fig.update_traces(
-            textposition='inside',
-            textinfo='percent+label',
-            textfont_size=12,
-            marker=dict(line=dict(color='#FFFFFF', width=2))
-        )
+        fig = build_pie_figure(company_size, _COMPANY_SIZE_COLORS)
         
-        st.plotly_chart(fig)
+        st.plotly_chart(fig, config=_PIE_CHART_CONFIG)
         
     except Exception as e:
         st.error(f"Error creating company size chart: {e}")
@@ -746,29 +831,10 @@ def main():
     """, unsafe_allow_html=True)
     
     # Info section with enhanced styling
-    st.markdown("""
-    <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                padding: 2rem; border-radius: 15px; margin: 2rem 0; 
-                box-shadow: 0 10px 30px rgba(0,0,0,0.2);">
-        <div style="display: flex; justify-content: space-around; text-align: center;">
-            <div style="color: white;">
-                <h3 style="margin: 0; font-size: 1.2rem; opacity: 0.9;">📍 City</h3>
-                <h2 style="margin: 0.5rem 0 0 0; font-size: 1.8rem; font-weight: 700;">{selected_city}</h2>
-            </div>
-            <div style="color: white;">
-                <h3 style="margin: 0; font-size: 1.2rem; opacity: 0.9;">💼 Position</h3>
-                <h2 style="margin: 0.5rem 0 0 0; font-size: 1.8rem; font-weight: 700;">{selected_report}</h2>
-            </div>
-            <div style="color: white;">
-                <h3 style="margin: 0; font-size: 1.2rem; opacity: 0.9;">📊 Analysis</h3>
-                <h2 style="margin: 0.5rem 0 0 0; font-size: 1.8rem; font-weight: 700;">Total Jobs</h2>
-            </div>
-        </div>
-    </div>
-    """.format(selected_city=selected_city, selected_report=selected_report), unsafe_allow_html=True)
-    
-    # Set default time period to Total
-    job_date = "Total"
+    st.markdown(
+        _INFO_BANNER_TEMPLATE.format(selected_city=selected_city, selected_report=selected_report),
+        unsafe_allow_html=True
+    )
     
     st.markdown("---")
     
@@ -779,21 +845,12 @@ def main():
     </div>
     """, unsafe_allow_html=True)
     
-    col1, col2 = st.columns([3, 1])
-    
-    with col1:
-        with st.container():
-            create_job_trends_chart(selected_report, selected_city, job_date, data_dir)
-    
-    with col2:
-        st.markdown("""
-        <div style="text-align: center; margin-bottom: 1rem;">
-            <h4 style="color: #0077b5; margin: 0;">🏙️ City Metrics</h4>
-        </div>
-        """, unsafe_allow_html=True)
-        create_city_metrics(selected_report, job_date, data_dir)
+    bundle = load_dashboard_data(selected_report, selected_city, data_dir)
+    create_trends_section(selected_report, selected_city, bundle)
     
     # Analytics section
+    breakdowns = bundle['breakdowns']
+    
     st.markdown(f"""
     <div class="section-header">
         📊 Market Analysis for {selected_city}
@@ -810,8 +867,8 @@ def main():
                 <h4 style="color: #0077b5; margin: 0;">👔 Seniority Level Distribution</h4>
             </div>
             """, unsafe_allow_html=True)
-            print(selected_report, selected_city, data_dir)
-            create_seniority_chart(selected_report, selected_city, data_dir)
+            logger.debug(f"Rendering breakdowns for {selected_report} in {selected_city} from {data_dir}")
+            create_seniority_chart(selected_report, selected_city, breakdowns)
     
     with col2:
         with st.container():
@@ -820,7 +877,7 @@ def main():
                 <h4 style="color: #0077b5; margin: 0;">💼 Employment Type Breakdown</h4>
             </div>
             """, unsafe_allow_html=True)
-            create_employment_type_chart(selected_report, selected_city, data_dir)
+            create_employment_type_chart(selected_report, selected_city, breakdowns)
     
     # Second row of charts
     col1, col2 = st.columns(2)
@@ -832,7 +889,7 @@ def main():
                 <h4 style="color: #0077b5; margin: 0;">🏭 Industry Distribution</h4>
             </div>
             """, unsafe_allow_html=True)
-            create_industries_chart(selected_report, selected_city, data_dir)
+            create_industries_chart(selected_report, selected_city, breakdowns)
     
     with col2:
         with st.container():
@@ -841,7 +898,7 @@ def main():
                 <h4 style="color: #0077b5; margin: 0;">🏢 Company Size Analysis</h4>
             </div>
             """, unsafe_allow_html=True)
-            create_company_size_chart(selected_report, selected_city, data_dir)
+            create_company_size_chart(selected_report, selected_city, breakdowns)
     
     # Footer
     st.markdown("""
@@ -2,9 +2,23 @@
 Dashboard utility functions for LinkedIn Job Trends
 """
 
+import csv
+import os
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+from ..utils.logger import get_logger
+from ..utils.parquet_copy import fresh_parquet_copy, write_parquet_copy
+from ..utils.paths import city_jobs_path
+
+logger = get_logger(__name__)
 
 
 # Translation mapping for job date options
@@ -15,6 +29,203 @@ JOB_DATE_OPTIONS = {
     'Total': 'Total_Jobs'
 }
 
+# Per-city job CSV columns summarized by get_city_data_summary, with their summary keys
+SUMMARY_COLUMNS = {
+    'seniority_level': 'seniority_levels',
+    'employment_type': 'employment_types',
+    'industries': 'industries',
+    'company_size': 'company_sizes'
+}
+
+
+def _read_csv_table(csv_path: Path, columns: Optional[Tuple[str, ...]] = None,
+                    dictionary: bool = False) -> pa.Table:
+    """
+    Read a CSV file into an Arrow table with pyarrow's multi-threaded parser.
+    
+    Args:
+        csv_path: Path to the CSV file
+        columns: Columns to parse; missing ones are skipped (optional)
+        dictionary: Dictionary-encode the parsed columns, giving categoricals in pandas
+    
+    Returns:
+        Arrow table with the available requested columns
+    """
+    convert_options = pacsv.ConvertOptions(strings_can_be_null=True)
+    
+    if columns is not None:
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            header = next(csv.reader(f), [])
+        include = [column for column in columns if column in header]
+        
+        # An empty include list would mean "all columns" to pyarrow
+        if not include:
+            return pa.table({})
+        
+        convert_options.include_columns = include
+        if dictionary:
+            convert_options.column_types = {column: pa.dictionary(pa.int32(), pa.string()) for column in include}
+    
+    return pacsv.read_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(use_threads=True),
+        # Descriptions and titles can hold quoted line breaks
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=convert_options
+    )
+
+
+@lru_cache(maxsize=64)
+def _read_csv_cached(path_str: str, mtime: float, columns: Optional[Tuple[str, ...]], dtype: Optional[str]) -> pd.DataFrame:
+    """
+    Read a CSV file, memoized on its path, modification time and read options.
+    
+    Callers must not mutate the result; use read_csv_cached instead.
+    
+    Args:
+        path_str: Path to the CSV file
+        mtime: Modification time of the file, so rewrites invalidate the cache
+        columns: Columns to parse, or None for all of them
+        dtype: dtype applied to every parsed column, or None to infer
+    
+    Returns:
+        Parsed DataFrame
+    """
+    df = _read_csv_table(Path(path_str), columns, dictionary=dtype == 'category').to_pandas()
+    if dtype is not None and dtype != 'category':
+        df = df.astype(dtype)
+    return df
+
+
+def read_csv_cached(csv_path: Path, columns: Optional[List[str]] = None, dtype: Optional[str] = None) -> pd.DataFrame:
+    """
+    Read a CSV file, reusing the parsed frame while the file is unchanged.
+    
+    Args:
+        csv_path: Path to the CSV file
+        columns: Columns to parse; missing ones are skipped (optional)
+        dtype: dtype applied to every parsed column, e.g. 'category' (optional)
+    
+    Returns:
+        Shallow copy of the cached DataFrame
+    """
+    columns = tuple(columns) if columns is not None else None
+    return _read_csv_cached(str(csv_path), csv_path.stat().st_mtime, columns, dtype).copy(deep=False)
+
+
+def ensure_parquet(csv_path: Path) -> Optional[Path]:
+    """
+    Make sure a columnar Parquet copy of a CSV file exists next to it.
+    
+    The copy is (re)written when it is missing or was made from another
+    version of the CSV.
+    
+    Args:
+        csv_path: Path to the source CSV file
+    
+    Returns:
+        Path to the Parquet file, or None if it could not be written
+    """
+    parquet_path = fresh_parquet_copy(csv_path)
+    if parquet_path is not None:
+        return parquet_path
+    
+    try:
+        # Stat before reading, so a CSV rewritten mid-read leaves a stale copy
+        source = csv_path.stat()
+        return write_parquet_copy(_read_csv_table(csv_path), csv_path, source)
+    
+    except (OSError, TypeError, ValueError, pa.ArrowException) as e:
+        logger.warning(f"Could not write Parquet copy of {csv_path}: {e}")
+        return None
+
+
+@lru_cache(maxsize=64)
+def _load_jobs_table_cached(path_str: str, mtime: float, columns: Tuple[str, ...],
+                            categories: Tuple[str, ...], dates: Tuple[str, ...]) -> pd.DataFrame:
+    """
+    Load columns of a jobs table, memoized on path, modification time and read options.
+    
+    Callers must not mutate the result; use load_jobs_table instead.
+    
+    Args:
+        path_str: Path to the CSV file
+        mtime: Modification time of the CSV file, so rewrites invalidate the cache
+        columns: Columns to load
+        categories: Columns to convert to categoricals
+        dates: Columns to parse as dates
+    
+    Returns:
+        DataFrame with the available requested columns
+    """
+    csv_path = Path(path_str)
+    parquet_path = ensure_parquet(csv_path)
+    
+    if parquet_path is not None:
+        available = set(pq.read_schema(parquet_path).names)
+        df = pd.read_parquet(parquet_path, columns=[column for column in columns if column in available])
+    else:
+        df = _read_csv_table(csv_path, columns).to_pandas()
+    
+    for column in categories:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    
+    for column in dates:
+        if column in df.columns:
+            df[column] = pd.to_datetime(df[column])
+    
+    return df
+
+
+def load_jobs_table(csv_path: Path, columns: List[str], categories: Optional[List[str]] = None,
+                    dates: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Load the requested columns of a jobs table, preferring its Parquet copy.
+    
+    Only the requested columns are decoded, and columns missing from the file
+    are skipped, so callers should check which ones came back.
+    
+    Args:
+        csv_path: Path to the CSV file
+        columns: Columns to load
+        categories: Columns to convert to categoricals (optional)
+        dates: Columns to parse as dates (optional)
+    
+    Returns:
+        Shallow copy of the DataFrame with the available requested columns
+    """
+    mtime = csv_path.stat().st_mtime
+    df = _load_jobs_table_cached(
+        str(csv_path), mtime, tuple(columns), tuple(categories or ()), tuple(dates or ())
+    )
+    return df.copy(deep=False)
+
+
+def convert_data_dir_to_parquet(data_dir: Path = None) -> int:
+    """
+    Write Parquet copies of every CSV file under the data directory.
+    
+    Useful as a one-off migration so the first dashboard load does not pay
+    for the conversion.
+    
+    Args:
+        data_dir: Directory containing the data (optional)
+    
+    Returns:
+        Number of CSV files with an up-to-date Parquet copy
+    """
+    if data_dir is None:
+        data_dir = Path("data/raw/JobData")
+    
+    converted = 0
+    for csv_path in sorted(data_dir.rglob("*.csv")):
+        if ensure_parquet(csv_path) is not None:
+            converted += 1
+    
+    logger.info(f"{converted} CSV files under {data_dir} have Parquet copies")
+    return converted
+
 
 def find_number_jobs_per_city(job_search: str, city: str, job_date: str, data_dir: Path = None) -> pd.DataFrame:
     """
@@ -37,13 +248,12 @@ def find_number_jobs_per_city(job_search: str, city: str, job_date: str, data_di
     if not csv_path.exists():
         raise FileNotFoundError(f"Data file not found: {csv_path}")
     
-    df = pd.read_csv(csv_path)
-    df = df[df['City'] == city]
-    
     if job_date not in JOB_DATE_OPTIONS:
         raise ValueError(f"Invalid job_date: {job_date}. Must be one of {list(JOB_DATE_OPTIONS.keys())}")
     
     column_name = JOB_DATE_OPTIONS[job_date]
+    df = load_jobs_table(csv_path, ['Date', 'City', column_name], categories=['City'], dates=['Date'])
+    df = df[df['City'] == city].sort_values(by='Date')
     df = df[['Date', 'City', column_name]]
     df.rename(columns={column_name: 'Total_Jobs'}, inplace=True)
     
@@ -70,32 +280,58 @@ def find_latest_jobs_cities(job_search: str, job_date: str, data_dir: Path = Non
     if not csv_path.exists():
         raise FileNotFoundError(f"Data file not found: {csv_path}")
     
-    df = pd.read_csv(csv_path)
-    
     if job_date not in JOB_DATE_OPTIONS:
         raise ValueError(f"Invalid job_date: {job_date}. Must be one of {list(JOB_DATE_OPTIONS.keys())}")
     
     column_name = JOB_DATE_OPTIONS[job_date]
+    df = load_jobs_table(csv_path, ['Date', 'City', column_name], categories=['City'], dates=['Date'])
     df = df[['Date', 'City', column_name]]
     df.rename(columns={column_name: 'Total_Jobs'}, inplace=True)
     
-    # Sort by date and group by city
-    df = df.sort_values(by='Date', ascending=False)
-    df = df.groupby('City').apply(lambda x: x.sort_values(by='Date')).reset_index(drop=True)
+    # Only cities reported on the latest date are returned, and each of them
+    # only needs its last two rows for the delta
+    latest_date = df['Date'].max()
+    df = df[df['City'].isin(df.loc[df['Date'] == latest_date, 'City'])]
     
-    # Calculate delta (change from previous period)
-    df['delta'] = df.groupby('City')['Total_Jobs'].diff()
+    # Sort by city then date in one stable pass
+    df = df.sort_values(['City', 'Date'], kind='mergesort')
+    df = df.groupby('City', sort=False, observed=True).tail(2).reset_index(drop=True)
+    
+    # Calculate delta (change from previous period): rows are grouped by city,
+    # so diff neighbours and zero the first row of each city
+    codes = df['City'].cat.codes.to_numpy()
+    values = df['Total_Jobs'].to_numpy(dtype=float)
+    delta = np.zeros_like(values)
+    delta[1:] = values[1:] - values[:-1]
+    delta[1:][codes[1:] != codes[:-1]] = 0
     
     # Fill NaN values and convert to int
     df['Total_Jobs'] = df['Total_Jobs'].fillna(0).astype(int)
-    df['delta'] = df['delta'].fillna(0).astype(int)
+    df['delta'] = np.nan_to_num(delta).astype(int)
     
     # Get only the latest data
-    df = df[df['Date'] == df['Date'].max()]
+    df = df[df['Date'] == latest_date]
     
     return df
 
 
+@lru_cache(maxsize=4)
+def _scan_reports(dir_str: str, mtime: float) -> Tuple[str, ...]:
+    """
+    List the sub-directories of the data directory, memoized on its modification time.
+    
+    Args:
+        dir_str: Directory containing the data
+        mtime: Modification time of the directory, so added reports invalidate the cache
+    
+    Returns:
+        Sorted report names
+    """
+    # DirEntry.is_dir() uses the type returned by the directory listing, so no extra stat per entry
+    with os.scandir(dir_str) as entries:
+        return tuple(sorted(entry.name for entry in entries if entry.is_dir()))
+
+
 def get_available_reports(data_dir: Path = None) -> List[str]:
     """
     Get list of available job reports from the data directory.
@@ -109,13 +345,56 @@ def get_available_reports(data_dir: Path = None) -> List[str]:
     if data_dir is None:
         data_dir = Path("data/raw/JobData")
     
-    if not data_dir.exists():
+    try:
+        mtime = data_dir.stat().st_mtime
+    except FileNotFoundError:
         return []
     
-    # Get all directories in the data directory
-    report_names = [folder.name for folder in data_dir.iterdir() if folder.is_dir()]
+    return list(_scan_reports(str(data_dir), mtime))
+
+
+@lru_cache(maxsize=64)
+def _city_data_summary_cached(path_str: str, mtime: float) -> Dict:
+    """
+    Summarize a per-city jobs file, memoized on its path and modification time.
+    
+    Callers must not mutate the result; use get_city_data_summary instead.
     
-    return sorted(report_names)
+    Args:
+        path_str: Path to the CSV file
+        mtime: Modification time of the CSV file, so rewrites invalidate the cache
+    
+    Returns:
+        Dictionary with summary statistics
+    """
+    csv_path = Path(path_str)
+    parquet_path = ensure_parquet(csv_path)
+    
+    if parquet_path is None:
+        # Only the summarized columns are parsed, as categoricals
+        df = read_csv_cached(csv_path, list(SUMMARY_COLUMNS), dtype='category')
+        
+        summary = {'total_jobs': len(df)}
+        for column, key in SUMMARY_COLUMNS.items():
+            summary[key] = df[column].value_counts().to_dict() if column in df.columns else {}
+        
+        return summary
+    
+    # Count straight from the Arrow columns, reading only the summarized ones
+    available = set(pq.read_schema(parquet_path).names)
+    table = pq.read_table(parquet_path, columns=[column for column in SUMMARY_COLUMNS if column in available])
+    
+    summary = {'total_jobs': pq.read_metadata(parquet_path).num_rows}
+    for column, key in SUMMARY_COLUMNS.items():
+        if column not in available:
+            summary[key] = {}
+            continue
+        
+        counts = pc.value_counts(table[column].drop_null()).to_pylist()
+        counts.sort(key=lambda item: item['counts'], reverse=True)
+        summary[key] = {item['values']: item['counts'] for item in counts}
+    
+    return summary
 
 
 def get_city_data_summary(job_search: str, city: str, data_dir: Path = None) -> Dict:
@@ -133,19 +412,57 @@ def get_city_data_summary(job_search: str, city: str, data_dir: Path = None) ->
     if data_dir is None:
         data_dir = Path("data/raw/JobData")
     
-    csv_path = data_dir / f"{job_search}/{job_search} in {city}.csv"
+    csv_path = city_jobs_path(data_dir, job_search, city)
     
     if not csv_path.exists():
         raise FileNotFoundError(f"Data file not found: {csv_path}")
     
-    df = pd.read_csv(csv_path)
+    summary = _city_data_summary_cached(str(csv_path), csv_path.stat().st_mtime)
     
-    summary = {
-        'total_jobs': len(df),
-        'seniority_levels': df['seniority_level'].value_counts().to_dict() if 'seniority_level' in df.columns else {},
-        'employment_types': df['employment_type'].value_counts().to_dict() if 'employment_type' in df.columns else {},
-        'industries': df['industries'].value_counts().to_dict() if 'industries' in df.columns else {},
-        'company_sizes': df['company_size'].value_counts().to_dict() if 'company_size' in df.columns else {}
-    }
+    # Copy the per-column dicts so callers cannot alter the cached summary
+    return {key: dict(value) if isinstance(value, dict) else value for key, value in summary.items()}
+
+
+def downsample_lttb(df: pd.DataFrame, x_column: str, y_column: str, n_out: int = 800) -> pd.DataFrame:
+    """
+    Downsample a time series with Largest-Triangle-Three-Buckets.
+    
+    Keeps the first and last points and, for each bucket in between, the point
+    forming the largest triangle with the previously kept point and the average
+    of the next bucket, which preserves the visual shape of the line.
+    
+    Args:
+        df: DataFrame sorted by x_column
+        x_column: Date column used as the x axis
+        y_column: Numeric column used as the y axis
+        n_out: Maximum number of points to keep
     
-    return summary
\ No newline at end of file
+    Returns:
+        DataFrame with at most n_out rows (unchanged if already small enough)
+    """
+    n = len(df)
+    if n_out < 3 or n <= n_out:
+        return df
+    
+    x = pd.to_datetime(df[x_column]).to_numpy(dtype='datetime64[ns]').astype(np.int64).astype(float)
+    y = df[y_column].to_numpy(dtype=float)
+    
+    bucket_size = (n - 2) / (n_out - 2)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = min(max(int((i + 2) * bucket_size) + 1, end + 1), n)
+        
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    
+    return df.iloc[selected]
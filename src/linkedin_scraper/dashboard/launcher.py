@@ -0,0 +1,21 @@
+"""
+Console entry point that serves the dashboard through Streamlit
+"""
+
+import sys
+from pathlib import Path
+
+
+def main():
+    """Run the dashboard with ``streamlit run``, forwarding any extra arguments."""
+    from streamlit.web import cli as stcli
+    
+    sys.argv = ["streamlit", "run", str(Path(__file__).resolve()), *sys.argv[1:]]
+    sys.exit(stcli.main())
+
+
+if __name__ == "__main__":
+    # Executed by Streamlit as the app script
+    from linkedin_scraper.dashboard.app import main as app_main
+    
+    app_main()
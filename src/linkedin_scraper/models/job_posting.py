@@ -2,77 +2,64 @@
 Job posting data model
 """
 
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, Optional, Tuple
+
 import pandas as pd
-from typing import Optional, Dict, Any
 
 
+@dataclass
 class JobPosting:
     """
     Represents a LinkedIn job posting with all relevant details.
+    
+    Attributes:
+        title: Job title
+        job_link: URL to the job posting
+        company: Company name
+        location: Job location
+        date_posted: Date when job was posted
+        time_posted: Time when job was posted
+        description: Job description
+        seniority_level: Required seniority level
+        employment_type: Type of employment (full-time, part-time, etc.)
+        job_function: Job function/category
+        industries: Industry sectors
+        applicants: Number of applicants
+        company_url: URL to company page
+        company_size: Company size
+        founded: Year company was founded
+        company_type: Type of company
+        industry: Company industry
+        headquarters: Company headquarters location
     """
     
-    def __init__(
-        self,
-        title: str,
-        job_link: str,
-        company: Optional[str] = None,
-        location: Optional[str] = None,
-        date_posted: Optional[str] = None,
-        time_posted: Optional[str] = None,
-        description: Optional[str] = None,
-        seniority_level: Optional[str] = None,
-        employment_type: Optional[str] = None,
-        job_function: Optional[str] = None,
-        industries: Optional[str] = None,
-        applicants: Optional[str] = None,
-        company_url: Optional[str] = None,
-        company_size: Optional[str] = None,
-        founded: Optional[str] = None,
-        company_type: Optional[str] = None,
-        industry: Optional[str] = None,
-        headquarters: Optional[str] = None
-    ):
-        """
-        Initialize a JobPosting object.
-        
-        Args:
-            title: Job title
-            job_link: URL to the job posting
-            company: Company name
-            location: Job location
-            date_posted: Date when job was posted
-            time_posted: Time when job was posted
-            description: Job description
-            seniority_level: Required seniority level
-            employment_type: Type of employment (full-time, part-time, etc.)
-            job_function: Job function/category
-            industries: Industry sectors
-            applicants: Number of applicants
-            company_url: URL to company page
-            company_size: Company size
-            founded: Year company was founded
-            company_type: Type of company
-            industry: Company industry
-            headquarters: Company headquarters location
-        """
-        self.title = title
-        self.company = company
-        self.location = location
-        self.date_posted = date_posted
-        self.job_link = job_link
-        self.description = description
-        self.seniority_level = seniority_level
-        self.employment_type = employment_type
-        self.job_function = job_function
-        self.industries = industries
-        self.applicants = applicants
-        self.company_url = company_url
-        self.time_posted = time_posted
-        self.company_size = company_size
-        self.founded = founded
-        self.company_type = company_type
-        self.industry = industry
-        self.headquarters = headquarters
+    title: str
+    job_link: str
+    company: Optional[str] = None
+    location: Optional[str] = None
+    date_posted: Optional[str] = None
+    time_posted: Optional[str] = None
+    description: Optional[str] = None
+    seniority_level: Optional[str] = None
+    employment_type: Optional[str] = None
+    job_function: Optional[str] = None
+    industries: Optional[str] = None
+    applicants: Optional[str] = None
+    company_url: Optional[str] = None
+    company_size: Optional[str] = None
+    founded: Optional[str] = None
+    company_type: Optional[str] = None
+    industry: Optional[str] = None
+    headquarters: Optional[str] = None
+    
+    # Column order of the exported CSVs
+    COLUMNS: ClassVar[Tuple[str, ...]] = (
+        'title', 'company', 'location', 'date_posted', 'job_link',
+        'description', 'seniority_level', 'employment_type', 'job_function',
+        'industries', 'applicants', 'company_url', 'time_posted',
+        'company_size', 'founded', 'company_type', 'industry', 'headquarters'
+    )
 
     def __str__(self) -> str:
         """String representation of the job posting."""
@@ -99,11 +86,11 @@ class JobPosting:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert job posting to dictionary."""
-        return self.__dict__
+        return {column: getattr(self, column) for column in self.COLUMNS}
     
     def to_df(self) -> pd.DataFrame:
         """Convert job posting to pandas DataFrame."""
-        return pd.DataFrame([self.__dict__])
+        return pd.DataFrame([self.to_dict()], columns=list(self.COLUMNS))
     
     def is_empty(self) -> bool:
         """Check if the job posting is empty (no essential data)."""
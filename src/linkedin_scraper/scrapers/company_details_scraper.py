@@ -2,30 +2,43 @@
 LinkedIn company details scraper
 """
 
-import pandas as pd
-from bs4 import BeautifulSoup
-from typing import Optional
+import threading
+from collections import OrderedDict
+from selectolax.lexbor import LexborHTMLParser
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 from ..utils.request_handler import RequestHandler
 from ..utils.logger import get_logger
+from config.settings import COMPANY_DETAILS_CACHE_SIZE, MAX_CONCURRENT_REQUESTS
 
 logger = get_logger(__name__)
 
+# Selector for the company facts rows (size, founded, headquarters, ...)
+_COMPANY_FACT_SEL = 'div[class="mb-2 flex papabear:mr-3 mamabear:mr-3 babybear:flex-wrap"]'
+
 
 class CompanyDetailsScraper:
     """
     Scrapes detailed information from LinkedIn company pages.
     """
     
-    def __init__(self, request_handler: Optional[RequestHandler] = None):
+    def __init__(self, request_handler: Optional[RequestHandler] = None,
+                 cache_size: int = COMPANY_DETAILS_CACHE_SIZE):
         """
         Initialize company details scraper.
         
         Args:
             request_handler: Custom request handler (optional)
+            cache_size: Number of company pages to remember, most recently used first
         """
         self.request_handler = request_handler or RequestHandler()
         
+        # Many postings share a company, so parsed details are kept by URL
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
         # LinkedIn-specific headers
         self.headers = {
             'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
@@ -45,7 +58,7 @@ class CompanyDetailsScraper:
             'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36'
         }
     
-    def _parse_response(self, response_text: str) -> pd.DataFrame:
+    def _parse_response(self, response_text: str) -> Dict[str, str]:
         """
         Parse company details from HTML response.
         
@@ -53,32 +66,29 @@ class CompanyDetailsScraper:
             response_text: HTML response text
             
         Returns:
-            DataFrame with company details
+            Dictionary of company details keyed by normalized field name
         """
-        soup = BeautifulSoup(response_text, 'html.parser')
+        tree = LexborHTMLParser(response_text)
         data = {}
         
         # Find company information elements
-        elements = soup.find_all('div', class_='mb-2 flex papabear:mr-3 mamabear:mr-3 babybear:flex-wrap')
+        elements = tree.css(_COMPANY_FACT_SEL)
         
         for element in elements:
-            key_elem = element.find('dt')
-            value_elem = element.find('dd')
+            key_elem = element.css_first('dt')
+            value_elem = element.css_first('dd')
             
             if key_elem and value_elem:
-                key = key_elem.get_text(strip=True)
-                value = value_elem.get_text(strip=True)
+                key = key_elem.text(strip=True)
+                value = value_elem.text(strip=True)
                 
                 # Normalize key names
                 normalized_key = key.replace(' ', '_').lower()
                 data[normalized_key] = value
         
-        # Create DataFrame
-        df = pd.DataFrame([data])
-        
-        return df
+        return data
     
-    def get_company_details(self, company_url: str) -> pd.DataFrame:
+    def get_company_details(self, company_url: str) -> Optional[Dict[str, str]]:
         """
         Get detailed information for a specific company.
         
@@ -86,12 +96,41 @@ class CompanyDetailsScraper:
             company_url: URL of the company page
             
         Returns:
-            DataFrame with company details
+            Dictionary of company details, or None if the request failed
         """
+        with self._cache_lock:
+            cached = self._cache.get(company_url)
+            if cached is not None:
+                self._cache.move_to_end(company_url)
+                return dict(cached)
+        
         response = self.request_handler.get(company_url, self.headers)
         
         if response is None:
             logger.error(f"Failed to get company details from {company_url}")
-            return pd.DataFrame()
+            return None
         
-        return self._parse_response(response.text)
\ No newline at end of file
+        details = self._parse_response(response.text)
+        
+        # Only successful fetches are cached, so failures are retried next time
+        with self._cache_lock:
+            self._cache[company_url] = details
+            self._cache.move_to_end(company_url)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        
+        return dict(details)
+    
+    def get_company_details_batch(self, company_urls: List[str], max_workers: int = MAX_CONCURRENT_REQUESTS) -> List[Optional[Dict[str, str]]]:
+        """
+        Get detailed information for several companies concurrently.
+        
+        Args:
+            company_urls: URLs of the company pages
+            max_workers: Maximum number of requests in flight
+            
+        Returns:
+            List of company details dictionaries (None for failed requests), in the same order as company_urls
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.get_company_details, company_urls))
\ No newline at end of file
@@ -4,16 +4,37 @@ LinkedIn job list scraper
 
 import re
 import pandas as pd
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Tuple
 from urllib.parse import quote
 
 from ..models.job_posting import JobPosting
 from ..utils.request_handler import RequestHandler
 from ..utils.logger import get_logger
+from config.settings import MAX_CONCURRENT_REQUESTS
 
 logger = get_logger(__name__)
 
+# Output columns of a job list, in JobPosting export order
+_JOB_COLUMNS = list(JobPosting.COLUMNS)
+_EMPTY_JOBS_DF = pd.DataFrame(columns=_JOB_COLUMNS)
+
+# Patterns and selectors used on every search page, compiled once
+_NUM_RE = re.compile(r'\d+')
+_JOB_CARD_SEL = 'div.base-search-card__info'
+_JOB_URL_CARD_CLASS = 'base-card relative w-full hover:no-underline focus:no-underline base-card--link base-search-card base-search-card--link job-search-card'
+_JOB_URL_CARD_SEL = f'div[class="{_JOB_URL_CARD_CLASS}"]'
+# Both card kinds in one selector group, so the page is walked once
+_JOB_CARDS_SEL = f'{_JOB_CARD_SEL}, {_JOB_URL_CARD_SEL}'
+_JOB_LINK_SEL = 'a[class="base-card__full-link absolute top-0 right-0 bottom-0 left-0 p-0 z-[2]"]'
+_TITLE_SEL = 'h3.base-search-card__title'
+_COMPANY_SEL = 'a.hidden-nested-link'
+_LOCATION_SEL = 'span.job-search-card__location'
+_DATE_SEL = 'time.job-search-card__listdate'
+_NEW_DATE_SEL = 'time.job-search-card__listdate--new'
+_TPR_LABEL_SEL = 'label[for^="f_TPR-"]'
+
 
 class JobListScraper:
     """
@@ -73,65 +94,60 @@ class JobListScraper:
         Returns:
             DataFrame of job listings
         """
-        soup = BeautifulSoup(response_text, 'html.parser')
+        tree = LexborHTMLParser(response_text)
         
-        # Find all job postings
-        job_postings = soup.find_all('div', class_='base-search-card__info')
-        job_posting_urls = soup.find_all('div', class_='base-card relative w-full hover:no-underline focus:no-underline base-card--link base-search-card base-search-card--link job-search-card')
+        # Find all job postings and their link cards in a single pass
+        job_postings = []
+        job_posting_urls = []
+        for node in tree.css(_JOB_CARDS_SEL):
+            if node.attributes.get('class') == _JOB_URL_CARD_CLASS:
+                job_posting_urls.append(node)
+            else:
+                job_postings.append(node)
         
         if not job_postings:
             logger.warning("No jobs found in response")
-            return JobPosting(
-                title=None, 
-                company=None, 
-                location=None, 
-                date_posted=None, 
-                job_link=None
-            ).to_df()
+            return _EMPTY_JOBS_DF.copy(deep=False)
         
         jobs_data = []
         
         for i, job_posting in enumerate(job_postings):
             try:
                 # Extract job title
-                title_elem = job_posting.find('h3', class_='base-search-card__title')
-                title = title_elem.get_text(strip=True) if title_elem else None
+                title_elem = job_posting.css_first(_TITLE_SEL)
+                title = title_elem.text(strip=True) if title_elem else None
                 
                 # Extract company name
-                company_elem = job_posting.find('a', class_='hidden-nested-link')
-                company = company_elem.get_text(strip=True) if company_elem else None
+                company_elem = job_posting.css_first(_COMPANY_SEL)
+                company = company_elem.text(strip=True) if company_elem else None
                 
                 # Extract location
-                location_elem = job_posting.find('span', class_='job-search-card__location')
-                location = location_elem.get_text(strip=True) if location_elem else None
+                location_elem = job_posting.css_first(_LOCATION_SEL)
+                location = location_elem.text(strip=True) if location_elem else None
                 
                 # Extract date posted
-                date_elem = job_posting.find('time', class_='job-search-card__listdate') or \
-                           job_posting.find('time', class_='job-search-card__listdate--new')
-                date_posted = date_elem.get_text(strip=True) if date_elem else None
+                date_elem = job_posting.css_first(_DATE_SEL) or job_posting.css_first(_NEW_DATE_SEL)
+                date_posted = date_elem.text(strip=True) if date_elem else None
                 
                 # Extract job link
                 job_link = None
                 if i < len(job_posting_urls):
-                    link_elem = job_posting_urls[i].find('a', class_='base-card__full-link absolute top-0 right-0 bottom-0 left-0 p-0 z-[2]')
-                    job_link = link_elem.get('href') if link_elem else None
+                    link_elem = job_posting_urls[i].css_first(_JOB_LINK_SEL)
+                    job_link = link_elem.attributes.get('href') if link_elem else None
                 
-                # Create job posting object
-                job = JobPosting(
-                    title=title,
-                    company=company,
-                    location=location,
-                    date_posted=date_posted,
-                    job_link=job_link
-                )
-                
-                jobs_data.append(job.to_dict())
+                jobs_data.append({
+                    'title': title,
+                    'company': company,
+                    'location': location,
+                    'date_posted': date_posted,
+                    'job_link': job_link
+                })
                 
             except Exception as e:
                 logger.error(f"Error parsing job posting {i}: {e}")
                 continue
         
-        return pd.DataFrame(jobs_data)
+        return pd.DataFrame(jobs_data, columns=_JOB_COLUMNS)
     
     def _parse_total_jobs(self, response_text: str) -> List[int]:
         """
@@ -143,27 +159,24 @@ class JobListScraper:
         Returns:
             List of [total, past_month, past_week, past_24h] job counts
         """
-        soup = BeautifulSoup(response_text, 'html.parser')
+        tree = LexborHTMLParser(response_text)
         
-        # Find job count elements
-        total_elem = soup.find('label', {'for': 'f_TPR-0'})
-        past_month_elem = soup.find('label', {'for': 'f_TPR-1'})
-        past_week_elem = soup.find('label', {'for': 'f_TPR-2'})
-        past_24h_elem = soup.find('label', {'for': 'f_TPR-3'})
+        # Find all job count elements in one pass, keyed by their "for" id
+        labels = {node.attributes.get('for'): node for node in tree.css(_TPR_LABEL_SEL)}
         
         def extract_count(elem) -> int:
             """Extract numeric count from element."""
             if elem:
-                text = elem.get_text(strip=True)
+                text = elem.text(strip=True)
                 # Extract last number from text
-                numbers = re.findall(r'\d+', text)
+                numbers = _NUM_RE.findall(text)
                 return int(numbers[-1]) if numbers else 0
             return 0
         
-        total_jobs = extract_count(total_elem)
-        past_month_jobs = extract_count(past_month_elem)
-        past_week_jobs = extract_count(past_week_elem)
-        past_24h_jobs = extract_count(past_24h_elem)
+        total_jobs = extract_count(labels.get('f_TPR-0'))
+        past_month_jobs = extract_count(labels.get('f_TPR-1'))
+        past_week_jobs = extract_count(labels.get('f_TPR-2'))
+        past_24h_jobs = extract_count(labels.get('f_TPR-3'))
         
         logger.info(f"Job counts - Total: {total_jobs}, Month: {past_month_jobs}, Week: {past_week_jobs}, 24h: {past_24h_jobs}")
         
@@ -189,6 +202,30 @@ class JobListScraper:
         
         return self._parse_total_jobs(response.text)
     
+    def get_first_page_and_total(self, job_title: str, location: str) -> Tuple[List[Optional[int]], pd.DataFrame]:
+        """
+        Get the job counts and the first page of listings with a single request.
+        
+        The first search page carries both the date filter counters and the
+        first batch of job cards, so one fetch serves get_total_jobs and
+        get_job_list(position=0).
+        
+        Args:
+            job_title: Job title to search for
+            location: Location to search in
+            
+        Returns:
+            Tuple of (job counts [total, past_month, past_week, past_24h], DataFrame of job listings)
+        """
+        url = self._build_search_url(job_title, location)
+        response = self.request_handler.get(url, self.headers)
+        
+        if response is None:
+            logger.error(f"Failed to get first search page for {job_title} in {location}")
+            return [None, None, None, None], _EMPTY_JOBS_DF.copy(deep=False)
+        
+        return self._parse_total_jobs(response.text), self._parse_jobs(response.text)
+    
     def get_job_list(self, job_title: str, location: str, position: int = 0) -> pd.DataFrame:
         """
         Get job listings for a search.
@@ -206,12 +243,25 @@ class JobListScraper:
         
         if response is None:
             logger.error(f"Failed to get job list for {job_title} in {location}")
-            return JobPosting(
-                title=None, 
-                company=None, 
-                location=None, 
-                date_posted=None, 
-                job_link=None
-            ).to_df()
-        
-        return self._parse_jobs(response.text)
\ No newline at end of file
+            return _EMPTY_JOBS_DF.copy(deep=False)
+        
+        return self._parse_jobs(response.text)
+    
+    def get_job_list_batch(self, job_title: str, location: str, positions: List[int],
+                           max_workers: int = MAX_CONCURRENT_REQUESTS) -> List[pd.DataFrame]:
+        """
+        Get several pages of job listings for a search concurrently.
+        
+        Args:
+            job_title: Job title to search for
+            location: Location to search in
+            positions: Starting positions of the pages to fetch
+            max_workers: Maximum number of requests in flight
+            
+        Returns:
+            List of job listing DataFrames, in the same order as positions
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda position: self.get_job_list(job_title, location, position), positions
+            ))
@@ -3,8 +3,9 @@ Main LinkedIn scraper orchestrator
 """
 
 import pandas as pd
+import pyarrow as pa
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..models.job_posting import JobPosting
 from .job_list_scraper import JobListScraper
@@ -12,27 +13,135 @@ from .job_details_scraper import JobDetailsScraper
 from .company_details_scraper import CompanyDetailsScraper
 from ..utils.request_handler import RequestHandler
 from ..utils.logger import get_logger
+from ..utils.parquet_copy import fresh_parquet_copy, write_parquet_copy
+from ..utils.paths import city_jobs_path, ensure_dir
+from config.settings import MAX_CONCURRENT_DETAILS, MAX_CONCURRENT_REQUESTS
 
 logger = get_logger(__name__)
 
+# Listing columns carried over from the input file, and detail fields added
+# by each enrichment step (detail key -> output column)
+_JOB_LIST_COLUMNS = ['title', 'company', 'location', 'date_posted', 'job_link']
+_JOB_DETAIL_FIELDS = {
+    'description': 'description',
+    'time_posted': 'time_posted',
+    'seniority_level': 'seniority_level',
+    'employment_type': 'employment_type',
+    'job_function': 'job_function',
+    'industries': 'industries',
+    'applicants': 'applicants',
+    'company_url': 'company_url'
+}
+_JOB_WITH_DETAILS_COLUMNS = _JOB_LIST_COLUMNS + list(_JOB_DETAIL_FIELDS.values())
+_COMPANY_DETAIL_FIELDS = {
+    'company_size': 'company_size',
+    'founded': 'founded',
+    'type': 'company_type',
+    'industry': 'industry',
+    'headquarters': 'headquarters'
+}
+
+
+def _save_jobs(df: pd.DataFrame, file_path: Path) -> None:
+    """
+    Save a jobs table as CSV, plus a Parquet copy for faster re-reads.
+    
+    The CSV stays the user-facing export; the Parquet copy next to it is what
+    the following pipeline steps and the dashboard read.
+    
+    Args:
+        df: Jobs table to save
+        file_path: Path of the CSV file
+    """
+    df.to_csv(file_path, index=False)
+    
+    try:
+        write_parquet_copy(pa.Table.from_pandas(df, preserve_index=False), file_path, file_path.stat())
+    except (OSError, TypeError, ValueError, pa.ArrowException) as e:
+        logger.warning(f"Could not write Parquet copy of {file_path}: {e}")
+
+
+def _load_jobs(file_path: Path) -> pd.DataFrame:
+    """
+    Load a jobs table, preferring its Parquet copy when it is up to date.
+    
+    Args:
+        file_path: Path of the CSV file
+        
+    Returns:
+        Jobs table
+    """
+    parquet_path = fresh_parquet_copy(file_path)
+    
+    if parquet_path is not None:
+        return pd.read_parquet(parquet_path)
+    
+    return pd.read_csv(file_path)
+
+
+def _urls_to_fetch(df: pd.DataFrame, column: str) -> Tuple[List[int], List[str]]:
+    """
+    Find the rows that have a URL to fetch details from.
+    
+    Args:
+        df: Input rows, with a default RangeIndex
+        column: Column holding the URLs
+        
+    Returns:
+        Tuple of (row positions, URLs), in row order
+    """
+    if column not in df.columns:
+        return [], []
+    
+    urls = df[column].dropna()
+    return urls.index.tolist(), urls.tolist()
+
+
+def _merge_details(df: pd.DataFrame, details_by_row: Dict[int, Optional[Dict[str, Any]]],
+                   base_columns: List[str], detail_fields: Dict[str, str]) -> pd.DataFrame:
+    """
+    Join fetched details onto the rows they were fetched for.
+    
+    Rows without fetched details are dropped, the rest keep their order.
+    
+    Args:
+        df: Input rows, with a default RangeIndex
+        details_by_row: Details dictionaries keyed by row position, None if the fetch failed
+        base_columns: Columns kept from the input rows
+        detail_fields: Detail keys to add, mapped to their output column names
+        
+    Returns:
+        DataFrame with the JobPosting columns, in JobPosting export order
+    """
+    rows = [i for i, details in details_by_row.items() if details]
+    
+    # Build the detail columns directly, already under their output names
+    details_df = pd.DataFrame(
+        {column: [details_by_row[i].get(key) for i in rows] for key, column in detail_fields.items()},
+        index=rows
+    )
+    base_df = df.reindex(index=rows, columns=base_columns)
+    
+    return base_df.join(details_df).reindex(columns=list(JobPosting.COLUMNS)).reset_index(drop=True)
+
 
 class LinkedInScraper:
     """
     Main orchestrator for LinkedIn job scraping operations.
     """
     
-    def __init__(self, data_dir: Optional[Path] = None):
+    def __init__(self, data_dir: Optional[Path] = None, request_handler: Optional[RequestHandler] = None):
         """
         Initialize LinkedIn scraper.
         
         Args:
             data_dir: Directory to store scraped data
+            request_handler: Custom request handler shared by all scrapers (optional)
         """
-        self.data_dir = data_dir or Path("data/raw")
-        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.data_dir = ensure_dir(data_dir or Path("data/raw"))
         
         # Initialize scrapers
-        request_handler = RequestHandler()
+        request_handler = request_handler or RequestHandler()
         self.job_list_scraper = JobListScraper(request_handler)
         self.job_details_scraper = JobDetailsScraper(request_handler)
         self.company_details_scraper = CompanyDetailsScraper(request_handler)
@@ -51,8 +160,8 @@ class LinkedInScraper:
         """
         logger.info(f"Starting job scraping for '{job_title}' in '{location}'")
         
-        # Get total job count
-        total_jobs = self.job_list_scraper.get_total_jobs(job_title, location)
+        # Get total job count and initial job list from the same first page
+        total_jobs, jobs_df = self.job_list_scraper.get_first_page_and_total(job_title, location)
         if total_jobs[0] is None:
             logger.error("Failed to get total job count")
             return None, None
@@ -61,146 +170,111 @@ class LinkedInScraper:
         actual_limit = min(total_jobs[0], limit)
         logger.info(f"Found {total_jobs[0]} total jobs, limiting to {actual_limit}")
         
-        # Get initial job list
-        jobs_df = self.job_list_scraper.get_job_list(job_title, location, 0)
-        
         if jobs_df.empty:
             logger.error("No jobs found in initial search")
             return None, None
         
-        # Paginate through results
-        for position in range(60, actual_limit, 10):
-            logger.info(f"Scraping positions {position}-{min(position + 10, actual_limit)}")
+        # Paginate through results, a window of pages at a time, stopping at
+        # the first empty page so at most one window of requests is wasted
+        pages = [jobs_df]
+        positions = list(range(60, actual_limit, 10))
+        
+        for start in range(0, len(positions), MAX_CONCURRENT_REQUESTS):
+            window = positions[start:start + MAX_CONCURRENT_REQUESTS]
+            logger.info(f"Scraping positions {window[0]}-{min(window[-1] + 10, actual_limit)}")
             
-            new_jobs = self.job_list_scraper.get_job_list(job_title, location, position)
+            new_pages = self.job_list_scraper.get_job_list_batch(job_title, location, window)
             
-            if new_jobs.empty or new_jobs['title'].isnull().all():
-                logger.warning(f"No more jobs found at position {position}")
-                break
+            exhausted = False
+            for position, new_jobs in zip(window, new_pages):
+                if new_jobs.empty or new_jobs['title'].isnull().all():
+                    logger.warning(f"No more jobs found at position {position}")
+                    exhausted = True
+                    break
+                pages.append(new_jobs)
             
-            jobs_df = pd.concat([jobs_df, new_jobs], ignore_index=True)
+            if exhausted:
+                break
+        
+        jobs_df = pd.concat(pages, ignore_index=True)
         
         # Save to file
-        file_path = self.data_dir / f"{job_title}/{job_title} in {location}.csv"
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        jobs_df.to_csv(file_path, index=False)
+        file_path = city_jobs_path(self.data_dir, job_title, location)
+        ensure_dir(file_path.parent)
+        _save_jobs(jobs_df, file_path)
         
         logger.info(f"Successfully scraped {len(jobs_df)} jobs and saved to {file_path}")
         return jobs_df, str(file_path)
     
-    def scrape_all_job_details(self, file_path: str) -> Tuple[Optional[pd.DataFrame], str]:
+    def scrape_all_job_details(self, file_path: str, df: Optional[pd.DataFrame] = None) -> Tuple[Optional[pd.DataFrame], str]:
         """
         Scrape detailed information for all jobs in a file.
         
         Args:
             file_path: Path to CSV file containing job listings
+            df: Job listings already in memory, to skip re-reading file_path (optional)
             
         Returns:
             Tuple of (DataFrame with details, file path)
         """
         logger.info(f"Starting job details scraping for {file_path}")
         
-        df = pd.read_csv(file_path)
-        jobs_with_details = []
+        if df is None:
+            df = _load_jobs(Path(file_path))
         
-        for i, row in df.iterrows():
-            logger.info(f"Processing job {i+1}/{len(df)}: {row.get('title', 'Unknown')}")
-            
-            job_url = row.get('job_link')
-            if pd.isna(job_url):
-                logger.warning(f"No job URL for row {i}")
-                continue
-            
-            # Get job details
-            job_details = self.job_details_scraper.get_job_details(job_url)
-            
-            if job_details.empty:
-                logger.warning(f"No details found for job {i}")
-                continue
-            
-            # Create enhanced job posting
-            job = JobPosting(
-                title=row.get('title'),
-                company=row.get('company'),
-                location=row.get('location'),
-                date_posted=row.get('date_posted'),
-                job_link=row.get('job_link'),
-                description=job_details['description'].iloc[0],
-                time_posted=job_details['time_posted'].iloc[0],
-                seniority_level=job_details['seniority_level'].iloc[0],
-                employment_type=job_details['employment_type'].iloc[0],
-                job_function=job_details['job_function'].iloc[0],
-                industries=job_details['industries'].iloc[0],
-                applicants=job_details['applicants'].iloc[0],
-                company_url=job_details['company_url'].iloc[0]
-            )
-            
-            jobs_with_details.append(job.to_dict())
+        # Fetch the details of every job with a URL concurrently
+        rows_to_fetch, job_urls = _urls_to_fetch(df, 'job_link')
+        fetched = self.job_details_scraper.get_job_details_batch(job_urls, max_workers=MAX_CONCURRENT_DETAILS)
+        details_by_row = dict(zip(rows_to_fetch, fetched))
+        
+        if len(rows_to_fetch) < len(df):
+            logger.warning(f"No job URL for {len(df) - len(rows_to_fetch)} jobs")
         
         # Create DataFrame and save
-        result_df = pd.DataFrame(jobs_with_details)
-        result_df.to_csv(file_path, index=False)
+        result_df = _merge_details(df, details_by_row, _JOB_LIST_COLUMNS, _JOB_DETAIL_FIELDS)
+        if len(result_df) < len(rows_to_fetch):
+            logger.warning(f"No details found for {len(rows_to_fetch) - len(result_df)} jobs")
+        
+        _save_jobs(result_df, Path(file_path))
         
         logger.info(f"Successfully added details to {len(result_df)} jobs")
         return result_df, file_path
     
-    def scrape_all_company_details(self, file_path: str) -> Tuple[Optional[pd.DataFrame], str]:
+    def scrape_all_company_details(self, file_path: str, df: Optional[pd.DataFrame] = None) -> Tuple[Optional[pd.DataFrame], str]:
         """
         Scrape company details for all jobs in a file.
         
         Args:
             file_path: Path to CSV file containing job listings
+            df: Job listings with details already in memory, to skip re-reading file_path (optional)
             
         Returns:
             Tuple of (DataFrame with company details, file path)
         """
         logger.info(f"Starting company details scraping for {file_path}")
         
-        df = pd.read_csv(file_path)
-        jobs_with_company_details = []
+        if df is None:
+            df = _load_jobs(Path(file_path))
         
-        for i, row in df.iterrows():
-            logger.info(f"Processing company {i+1}/{len(df)}: {row.get('company', 'Unknown')}")
-            
-            company_url = row.get('company_url')
-            if pd.isna(company_url):
-                logger.warning(f"No company URL for row {i}")
-                continue
-            
-            # Get company details
-            company_details = self.company_details_scraper.get_company_details(company_url)
-            
-            if company_details.empty:
-                logger.warning(f"No company details found for row {i}")
-                continue
-            
-            # Create enhanced job posting with company details
-            job = JobPosting(
-                title=row.get('title'),
-                company=row.get('company'),
-                location=row.get('location'),
-                date_posted=row.get('date_posted'),
-                job_link=row.get('job_link'),
-                description=row.get('description'),
-                time_posted=row.get('time_posted'),
-                seniority_level=row.get('seniority_level'),
-                employment_type=row.get('employment_type'),
-                job_function=row.get('job_function'),
-                industries=row.get('industries'),
-                applicants=row.get('applicants'),
-                company_url=row.get('company_url'),
-                company_size=company_details.get('company_size', [None]).iloc[0] if 'company_size' in company_details.columns else None,
-                founded=company_details.get('founded', [None]).iloc[0] if 'founded' in company_details.columns else None,
-                company_type=company_details.get('type', [None]).iloc[0] if 'type' in company_details.columns else None,
-                industry=company_details.get('industry', [None]).iloc[0] if 'industry' in company_details.columns else None,
-                headquarters=company_details.get('headquarters', [None]).iloc[0] if 'headquarters' in company_details.columns else None
-            )
-            
-            jobs_with_company_details.append(job.to_dict())
+        # Fetch the details of every distinct company concurrently; many
+        # postings share a company, so each page is requested once
+        rows_to_fetch, company_urls = _urls_to_fetch(df, 'company_url')
+        unique_urls = list(dict.fromkeys(company_urls))
+        fetched = self.company_details_scraper.get_company_details_batch(
+            unique_urls, max_workers=MAX_CONCURRENT_DETAILS
+        )
+        details_by_url = dict(zip(unique_urls, fetched))
+        details_by_row = {i: details_by_url[url] for i, url in zip(rows_to_fetch, company_urls)}
+        
+        if len(rows_to_fetch) < len(df):
+            logger.warning(f"No company URL for {len(df) - len(rows_to_fetch)} jobs")
         
         # Create DataFrame and save
-        result_df = pd.DataFrame(jobs_with_company_details)
-        result_df.to_csv(file_path, index=False)
+        result_df = _merge_details(df, details_by_row, _JOB_WITH_DETAILS_COLUMNS, _COMPANY_DETAIL_FIELDS)
+        if len(result_df) < len(rows_to_fetch):
+            logger.warning(f"No company details found for {len(rows_to_fetch) - len(result_df)} jobs")
+        
+        _save_jobs(result_df, Path(file_path))
         
         logger.info(f"Successfully added company details to {len(result_df)} jobs")
         return result_df, file_path
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""
+Parquet copies of CSV exports
+"""
+
+import os
+import tempfile
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pathlib import Path
+from typing import Optional
+
+# Schema metadata keys recording which version of the CSV a copy was made from
+_SOURCE_MTIME_KEY = b'source_mtime_ns'
+_SOURCE_SIZE_KEY = b'source_size'
+
+
+def parquet_copy_path(csv_path: Path) -> Path:
+    """
+    Build the path of the Parquet copy kept next to a CSV file.
+    
+    Args:
+        csv_path: Path to the source CSV file
+    
+    Returns:
+        Path of the Parquet copy
+    """
+    return csv_path.with_suffix('.parquet')
+
+
+def fresh_parquet_copy(csv_path: Path) -> Optional[Path]:
+    """
+    Find the Parquet copy of a CSV file, if it was made from the current CSV.
+    
+    The copy records the modification time (in nanoseconds) and size of the
+    CSV it was made from, so any rewrite of the CSV invalidates it regardless
+    of filesystem timestamp resolution or clock skew.
+    
+    Args:
+        csv_path: Path to the source CSV file
+    
+    Returns:
+        Path to the Parquet copy, or None if it is missing, stale or unreadable
+    """
+    parquet_path = parquet_copy_path(csv_path)
+    
+    try:
+        metadata = pq.read_schema(parquet_path).metadata or {}
+        source = csv_path.stat()
+    except (OSError, pa.ArrowException):
+        return None
+    
+    if (metadata.get(_SOURCE_MTIME_KEY) == str(source.st_mtime_ns).encode()
+            and metadata.get(_SOURCE_SIZE_KEY) == str(source.st_size).encode()):
+        return parquet_path
+    
+    return None
+
+
+def write_parquet_copy(table: pa.Table, csv_path: Path, source: os.stat_result) -> Path:
+    """
+    Atomically write the Parquet copy of a CSV file.
+    
+    The table is written to a temporary file in the same directory and moved
+    into place, so readers never see a partially written copy.
+    
+    Args:
+        table: Contents of the CSV file
+        csv_path: Path to the source CSV file
+        source: Stat of the CSV taken before its contents were read
+    
+    Returns:
+        Path to the Parquet copy
+    """
+    parquet_path = parquet_copy_path(csv_path)
+    table = table.replace_schema_metadata({
+        **(table.schema.metadata or {}),
+        _SOURCE_MTIME_KEY: str(source.st_mtime_ns).encode(),
+        _SOURCE_SIZE_KEY: str(source.st_size).encode()
+    })
+    
+    fd, tmp_name = tempfile.mkstemp(dir=parquet_path.parent, prefix=f".{parquet_path.name}.", suffix='.tmp')
+    os.close(fd)
+    
+    try:
+        pq.write_table(table, tmp_name, compression='zstd')
+        os.replace(tmp_name, parquet_path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    
+    return parquet_path
@@ -0,0 +1,44 @@
+"""
+Filesystem path utilities
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=None)
+def ensure_dir(path: Path) -> Path:
+    """
+    Create a directory (and its parents) once per process.
+    
+    Subsequent calls for the same path are served from the cache instead of
+    issuing another mkdir syscall.
+    
+    Args:
+        path: Directory to create
+    
+    Returns:
+        The directory path
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@lru_cache(maxsize=256)
+def city_jobs_path(data_dir: Path, job_title: str, location: str) -> Path:
+    """
+    Build the path of the per-city jobs CSV for a job title.
+    
+    The scraper writes to this path and the dashboard reads from it, so the
+    naming scheme lives in one place. Names are kept verbatim because the
+    dashboard lists reports by their directory names.
+    
+    Args:
+        data_dir: Directory containing the data
+        job_title: Job title the data was scraped for
+        location: City the data was scraped for
+    
+    Returns:
+        Path of the CSV file
+    """
+    return data_dir / job_title / f"{job_title} in {location}.csv"
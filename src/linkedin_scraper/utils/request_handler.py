@@ -2,13 +2,67 @@
 HTTP request handling utilities with retry logic and rate limiting
 """
 
+import random
+import threading
 import time
 import requests
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, Tuple
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Validator cache key: (URL, sorted per-call headers)
+_ValidatorKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket capping the request rate across worker threads.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize token bucket.
+        
+        Args:
+            rate: Tokens added per second, i.e. the sustained requests per second
+            capacity: Largest burst allowed after an idle period (defaults to one second's worth)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._held_until = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                
+                if now >= self._held_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                wait = max(self._held_until - now, (1 - self._tokens) / self.rate)
+            
+            time.sleep(wait)
+    
+    def hold(self, seconds: float) -> None:
+        """
+        Stop handing out tokens for a while, e.g. after a rate limit response.
+        
+        Args:
+            seconds: How long every worker should pause
+        """
+        with self._lock:
+            self._held_until = max(self._held_until, time.monotonic() + seconds)
+
 
 class RequestHandler:
     """
@@ -20,7 +74,12 @@ class RequestHandler:
         max_retries: int = 5,
         base_delay: int = 5,
         rate_limit_delay: int = 15,
-        headers: Optional[Dict[str, str]] = None
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30,
+        max_delay: float = 300,
+        pool_size: int = 10,
+        validator_cache_size: int = 64,
+        requests_per_second: Optional[float] = None
     ):
         """
         Initialize request handler.
@@ -30,13 +89,52 @@ class RequestHandler:
             base_delay: Base delay between retries in seconds
             rate_limit_delay: Delay for rate limit errors in seconds
             headers: Default headers for requests
+            timeout: Connect/read timeout per request in seconds
+            max_delay: Upper bound on a single retry delay in seconds
+            pool_size: Keep-alive connections kept per host, at least the number of worker threads
+            validator_cache_size: Number of GET page bodies kept for conditional re-requests (0 disables)
+            requests_per_second: Request rate shared by all threads using this handler (None for no cap)
         """
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.rate_limit_delay = rate_limit_delay
         self.headers = headers or {}
+        self.timeout = timeout
+        self.max_delay = max_delay
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        
+        # Size the pool for the worker threads sharing this session; retries
+        # are handled by make_request, not urllib3
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # (ETag, Last-Modified, body text) of recent pages, by URL and per-call
+        # headers, so a repeat GET can be answered with 304 Not Modified
+        self.validator_cache_size = validator_cache_size
+        self._validated: "OrderedDict[_ValidatorKey, Tuple[Optional[str], Optional[str], str]]" = OrderedDict()
+        self._validated_lock = threading.Lock()
+        
+        # One bucket for every thread sharing this handler, so concurrent
+        # workers together stay under the rate cap
+        self.limiter = TokenBucket(requests_per_second) if requests_per_second else None
+    
+    def backoff_delay(self, base_delay: float, current_trial: int) -> float:
+        """
+        Compute an exponential backoff delay with random jitter.
+        
+        The jitter keeps concurrent workers that failed together from
+        retrying in lockstep.
+        
+        Args:
+            base_delay: Delay of the first retry in seconds
+            current_trial: Current trial number
+            
+        Returns:
+            Delay in seconds, capped at max_delay
+        """
+        return min(self.max_delay, base_delay * 2 ** current_trial + random.uniform(0, base_delay))
     
     def handle_response(self, response: requests.Response, current_trial: int = 0) -> bool:
         """
@@ -59,12 +157,14 @@ class RequestHandler:
             logger.warning(f"Request failed with status {status}, retrying...")
             
             if status == 429:  # Rate limited
-                delay = self.rate_limit_delay * current_trial
-                logger.info(f"Rate limited, waiting {delay} seconds")
+                delay = self.backoff_delay(self.rate_limit_delay, current_trial)
+                logger.info(f"Rate limited, waiting {delay:.1f} seconds")
+                if self.limiter is not None:
+                    self.limiter.hold(delay)
                 time.sleep(delay)
             else:
-                delay = self.base_delay * current_trial
-                logger.info(f"Request failed, waiting {delay} seconds")
+                delay = self.backoff_delay(self.base_delay, current_trial)
+                logger.info(f"Request failed, waiting {delay:.1f} seconds")
                 time.sleep(delay)
             
             return False
@@ -73,13 +173,100 @@ class RequestHandler:
             logger.error("Max retries reached")
             return None
     
+    @staticmethod
+    def _validator_key(url: str, headers: Optional[Dict[str, str]]) -> _ValidatorKey:
+        """
+        Build the validator cache key of a GET request.
+        
+        Per-call headers such as cookies can change the page the server
+        returns, so they are part of the key along with the URL.
+        
+        Args:
+            url: Request URL
+            headers: Per-call headers (optional)
+            
+        Returns:
+            Tuple of (URL, sorted per-call headers with lower-cased names)
+        """
+        return url, tuple(sorted((name.lower(), value) for name, value in (headers or {}).items()))
+    
+    def _cached_validators(self, key: _ValidatorKey) -> Optional[Tuple[Optional[str], Optional[str], str]]:
+        """
+        Get the cached validators and body text of a request.
+        
+        The cache only lives in memory, so it only helps when the same URL is
+        requested again within one process.
+        
+        Args:
+            key: Validator cache key, from _validator_key
+            
+        Returns:
+            Tuple of (ETag, Last-Modified, body text), or None if not cached
+        """
+        with self._validated_lock:
+            entry = self._validated.get(key)
+            if entry is not None:
+                self._validated.move_to_end(key)
+            return entry
+    
+    def _remember_validators(self, key: _ValidatorKey, response: requests.Response) -> None:
+        """
+        Cache the validators and body text of a successful GET, if the server sent validators.
+        
+        Only the body text is kept, not the response object, and the cache is
+        bounded to validator_cache_size entries.
+        
+        Args:
+            key: Validator cache key, from _validator_key
+            response: Successful response
+        """
+        if self.validator_cache_size <= 0:
+            return
+        
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        
+        if not etag and not last_modified:
+            return
+        
+        with self._validated_lock:
+            self._validated[key] = (etag, last_modified, response.text)
+            self._validated.move_to_end(key)
+            if len(self._validated) > self.validator_cache_size:
+                self._validated.popitem(last=False)
+    
+    @staticmethod
+    def _response_from_cache(not_modified: requests.Response, text: str) -> requests.Response:
+        """
+        Build a 200 response serving a cached body, from a 304 Not Modified.
+        
+        Callers get the same kind of response as for a full download, with the
+        headers and request of the 304.
+        
+        Args:
+            not_modified: 304 response to the conditional GET
+            text: Cached body text
+            
+        Returns:
+            Response with status 200 and the cached body
+        """
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response._content = text.encode('utf-8')
+        response.encoding = 'utf-8'
+        response.headers = not_modified.headers
+        response.url = not_modified.url
+        response.request = not_modified.request
+        response.elapsed = not_modified.elapsed
+        return response
+    
     def make_request(
         self,
         url: str,
         method: str = "GET",
         headers: Optional[Dict[str, str]] = None,
-        data: Optional[Dict[str, Any]] = None,
-        current_trial: int = 0
+        data: Optional[Dict[str, Any]] = None
     ) -> Optional[requests.Response]:
         """
         Make HTTP request with retry logic.
@@ -87,42 +274,58 @@ class RequestHandler:
         Args:
             url: Request URL
             method: HTTP method
-            headers: Additional headers
+            headers: Additional headers, merged over the session defaults
             data: Request data
-            current_trial: Current trial number
             
         Returns:
             Response object or None if failed
         """
-        request_headers = {**self.headers}
-        if headers:
-            request_headers.update(headers)
+        method = method.upper()
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
         
-        try:
-            if method.upper() == "GET":
-                response = self.session.get(url, headers=request_headers)
-            elif method.upper() == "POST":
-                response = self.session.post(url, headers=request_headers, data=data)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+        # Revalidate previously fetched pages instead of downloading them again
+        key = self._validator_key(url, headers) if method == "GET" else None
+        cached = self._cached_validators(key) if key is not None else None
+        if cached is not None:
+            etag, last_modified, _ = cached
+            headers = dict(headers or {})
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
+        # The session already carries the default headers; requests merges
+        # the per-call ones over them
+        for trial in range(self.max_retries + 1):
+            if self.limiter is not None:
+                self.limiter.acquire()
             
-            result = self.handle_response(response, current_trial)
+            try:
+                response = self.session.request(
+                    method, url, headers=headers, data=data, timeout=self.timeout
+                )
+            except requests.RequestException as e:
+                logger.error(f"Request exception: {e}")
+                if trial < self.max_retries:
+                    time.sleep(self.backoff_delay(self.base_delay, trial))
+                    continue
+                return None
+            
+            if cached is not None and response.status_code == 304:
+                logger.debug(f"Not modified, reusing cached body for {url}")
+                return self._response_from_cache(response, cached[2])
+            
+            result = self.handle_response(response, trial)
             
             if result is True:
+                if key is not None:
+                    self._remember_validators(key, response)
                 return response
-            elif result is False:
-                return self.make_request(url, method, headers, data, current_trial + 1)
-            else:
-                return None
-                
-        except requests.RequestException as e:
-            logger.error(f"Request exception: {e}")
-            if current_trial < self.max_retries:
-                delay = self.base_delay * current_trial
-                time.sleep(delay)
-                return self.make_request(url, method, headers, data, current_trial + 1)
-            else:
+            elif result is None:
                 return None
+        
+        return None
     
     def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[requests.Response]:
         """Make GET request."""
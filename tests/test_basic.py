@@ -2,8 +2,11 @@
 Basic tests for LinkedIn Job Trends Scraper
 """
 
+import os
 import pytest
 import sys
+import time
+import pandas as pd
 from pathlib import Path
 
 # Add src to path for testing
@@ -11,7 +14,20 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from src.linkedin_scraper.models.job_posting import JobPosting
 from src.linkedin_scraper.utils.logger import setup_logger
-from src.linkedin_scraper.dashboard.dashboard_functions import JOB_DATE_OPTIONS
+from src.linkedin_scraper.utils.parquet_copy import fresh_parquet_copy
+from src.linkedin_scraper.utils.request_handler import RequestHandler, TokenBucket
+from src.linkedin_scraper.dashboard.dashboard_functions import (
+    JOB_DATE_OPTIONS,
+    downsample_lttb,
+    ensure_parquet,
+    find_latest_jobs_cities,
+    get_city_data_summary,
+    load_jobs_table
+)
+from src.linkedin_scraper.core.orchestrator import ScrapingOrchestrator
+from src.linkedin_scraper.scrapers.linkedin_scraper import LinkedInScraper
+from src.linkedin_scraper.scrapers.job_list_scraper import JobListScraper
+from src.linkedin_scraper.scrapers.company_details_scraper import CompanyDetailsScraper
 
 
 def test_job_posting_creation():
@@ -57,6 +73,511 @@ def test_logger_setup():
     assert logger.name == "test_logger"
 
 
+class _StubJobListScraper:
+    """Job list scraper returning canned job counts per city."""
+    
+    def __init__(self, counts):
+        self.counts = counts
+        self.calls = 0
+    
+    def get_total_jobs(self, job_title, location):
+        self.calls += 1
+        return self.counts[location]
+
+
+def test_create_city_comparison_keeps_city_order(tmp_path):
+    """Test city comparison rows follow the requested city order."""
+    orchestrator = ScrapingOrchestrator(tmp_path)
+    orchestrator.job_list_scraper = _StubJobListScraper({
+        "Ottawa": [100, 50, 20, 5],
+        "Toronto": [300, 150, 60, 15],
+        "Montreal": [200, 100, 40, 10],
+    })
+    
+    df = orchestrator.create_city_comparison("Software Engineer", ["Ottawa", "Toronto", "Montreal"])
+    
+    assert list(df["City"]) == ["Ottawa", "Toronto", "Montreal"]
+    assert list(df["Total_Jobs"]) == [100, 300, 200]
+    assert list(df["24h_Jobs"]) == [5, 15, 10]
+    assert (tmp_path / "Software Engineer/TotalJobs/TotalJobs.csv").exists()
+
+
+def test_create_city_comparison_skips_failed_cities(tmp_path):
+    """Test a failed city is skipped and the other cities are kept."""
+    orchestrator = ScrapingOrchestrator(tmp_path)
+    orchestrator.job_list_scraper = _StubJobListScraper({
+        "Ottawa": [100, 50, 20, 5],
+        "Toronto": [None, None, None, None],
+    })
+    
+    df = orchestrator.create_city_comparison("Software Engineer", ["Ottawa", "Toronto"])
+    assert list(df["City"]) == ["Ottawa"]
+    
+    orchestrator.job_list_scraper = _StubJobListScraper({"Toronto": [None, None, None, None]})
+    assert orchestrator.create_city_comparison("Internship", ["Toronto"]) is None
+
+
+def test_scrape_city_data_retries_failed_cities(tmp_path, monkeypatch):
+    """Test cities that fail are retried once after the first pass."""
+    monkeypatch.setattr("src.linkedin_scraper.core.orchestrator.time.sleep", lambda seconds: None)
+    orchestrator = ScrapingOrchestrator(tmp_path)
+    attempts = []
+    
+    def scrape_one_city(job_title, city):
+        attempts.append(city)
+        return city != "Toronto" or attempts.count("Toronto") > 1
+    
+    orchestrator._scrape_one_city = scrape_one_city
+    orchestrator.scrape_city_data("Software Engineer", ["Ottawa", "Toronto"])
+    
+    assert sorted(attempts) == ["Ottawa", "Toronto", "Toronto"]
+
+
+def test_scrape_city_data_survives_unexpected_errors(tmp_path, monkeypatch):
+    """Test an unexpected exception in one city does not stop the others or the retry."""
+    monkeypatch.setattr("src.linkedin_scraper.core.orchestrator.time.sleep", lambda seconds: None)
+    orchestrator = ScrapingOrchestrator(tmp_path)
+    attempts = []
+    
+    def scrape_one_city(job_title, city):
+        attempts.append(city)
+        if city == "Toronto" and attempts.count("Toronto") == 1:
+            raise TypeError("parser changed")
+        return True
+    
+    orchestrator._scrape_one_city = scrape_one_city
+    orchestrator.scrape_city_data("Software Engineer", ["Ottawa", "Toronto", "Montreal"])
+    
+    assert sorted(attempts) == ["Montreal", "Ottawa", "Toronto", "Toronto"]
+
+
+def test_create_city_comparison_appends_history(tmp_path):
+    """Test repeated comparisons append to the history and reuse cached counts."""
+    orchestrator = ScrapingOrchestrator(tmp_path)
+    orchestrator.job_list_scraper = _StubJobListScraper({"Ottawa": [100, 50, 20, 5]})
+    
+    orchestrator.create_city_comparison("Software Engineer", ["Ottawa"])
+    orchestrator.create_city_comparison("Software Engineer", ["Ottawa"])
+    
+    history = pd.read_csv(tmp_path / "Software Engineer/TotalJobs/TotalJobs.csv")
+    assert len(history) == 2
+    assert orchestrator.job_list_scraper.calls == 1
+    assert list(history.columns) == ['City', '24h_Jobs', 'Week_Jobs', 'Month_Jobs', 'Total_Jobs', 'Date']
+    
+    # A new orchestrator reuses the persisted counts
+    restarted = ScrapingOrchestrator(tmp_path)
+    restarted.job_list_scraper = _StubJobListScraper({"Ottawa": [100, 50, 20, 5]})
+    restarted.create_city_comparison("Software Engineer", ["Ottawa"])
+    assert restarted.job_list_scraper.calls == 0
+
+
+def test_downsample_lttb():
+    """Test LTTB keeps the endpoints and the requested number of points."""
+    df = pd.DataFrame({
+        'Date': pd.date_range("2020-01-01", periods=2000).strftime('%Y-%m-%d'),
+        'Total_Jobs': range(2000)
+    })
+    
+    sampled = downsample_lttb(df, 'Date', 'Total_Jobs', n_out=100)
+    
+    assert len(sampled) == 100
+    assert sampled.index[0] == 0
+    assert sampled.index[-1] == 1999
+    assert sampled.index.is_monotonic_increasing
+    assert downsample_lttb(df.head(50), 'Date', 'Total_Jobs', n_out=100).equals(df.head(50))
+
+
+def test_load_jobs_table_prefers_parquet(tmp_path):
+    """Test the jobs table is read from a fresh Parquet copy, skipping missing columns."""
+    csv_path = tmp_path / "jobs.csv"
+    pd.DataFrame({
+        'title': ['a', 'b'],
+        'seniority_level': ['Entry level', 'Director']
+    }).to_csv(csv_path, index=False)
+    
+    df = load_jobs_table(csv_path, ['seniority_level', 'industries'])
+    
+    assert list(df.columns) == ['seniority_level']
+    assert df['seniority_level'].tolist() == ['Entry level', 'Director']
+    assert csv_path.with_suffix('.parquet').exists()
+
+
+def test_ensure_parquet_rewrites_copy_of_changed_csv(tmp_path):
+    """Test a Parquet copy is tied to the CSV it was made from, not to timestamps."""
+    csv_path = tmp_path / "jobs.csv"
+    pd.DataFrame({'title': ['a', 'b']}).to_csv(csv_path, index=False)
+    parquet_path = ensure_parquet(csv_path)
+    
+    # Rewrite the CSV, then make the stale copy look newer than it
+    pd.DataFrame({'title': ['a', 'b', 'c']}).to_csv(csv_path, index=False)
+    os.utime(parquet_path, (time.time() + 60, time.time() + 60))
+    
+    assert ensure_parquet(csv_path) == parquet_path
+    assert pd.read_parquet(parquet_path)['title'].tolist() == ['a', 'b', 'c']
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["jobs.csv", "jobs.parquet"]
+
+
+def test_load_jobs_table_handles_multiline_values(tmp_path):
+    """Test quoted line breaks survive the threaded CSV parser across blocks."""
+    csv_path = tmp_path / "jobs.csv"
+    pd.DataFrame({
+        'title': [f"Engineer {i}\nSenior" for i in range(200000)],
+        'seniority_level': ['Entry level'] * 200000
+    }).to_csv(csv_path, index=False)
+    
+    df = load_jobs_table(csv_path, ['title'])
+    
+    assert len(df) == 200000
+    assert df['title'].iloc[-1] == "Engineer 199999\nSenior"
+
+
+def test_get_city_data_summary(tmp_path):
+    """Test the city summary counts values per column and skips missing ones."""
+    (tmp_path / "Software Engineer").mkdir()
+    pd.DataFrame({
+        'title': ['a', 'b', 'c', 'd'],
+        'seniority_level': ['Entry level', 'Mid-Senior level', 'Entry level', None],
+        'industries': ['IT', 'IT', 'Banking', 'IT']
+    }).to_csv(tmp_path / "Software Engineer" / "Software Engineer in Ottawa.csv", index=False)
+    
+    summary = get_city_data_summary("Software Engineer", "Ottawa", tmp_path)
+    
+    assert summary == {
+        'total_jobs': 4,
+        'seniority_levels': {'Entry level': 2, 'Mid-Senior level': 1},
+        'employment_types': {},
+        'industries': {'IT': 3, 'Banking': 1},
+        'company_sizes': {}
+    }
+
+
+def test_get_city_data_summary_handles_empty_columns(tmp_path):
+    """Test columns with no values at all summarize to empty counts."""
+    (tmp_path / "Software Engineer").mkdir()
+    csv_path = tmp_path / "Software Engineer" / "Software Engineer in Toronto.csv"
+    pd.DataFrame({
+        'title': ['a', 'b'],
+        'seniority_level': ['Entry level', 'Entry level'],
+        'industries': [None, None],
+        'company_size': [None, None]
+    }).to_csv(csv_path, index=False)
+    
+    summary = get_city_data_summary("Software Engineer", "Toronto", tmp_path)
+    
+    assert csv_path.with_suffix('.parquet').exists()
+    assert summary['total_jobs'] == 2
+    assert summary['seniority_levels'] == {'Entry level': 2}
+    assert summary['industries'] == {}
+    assert summary['company_sizes'] == {}
+    
+    # Repeat calls are served from the cache and cannot be altered by callers
+    summary['industries']['IT'] = 1
+    assert get_city_data_summary("Software Engineer", "Toronto", tmp_path)['industries'] == {}
+
+
+def test_find_latest_jobs_cities(tmp_path):
+    """Test the latest counts per city come with the change since the previous date."""
+    totals_dir = tmp_path / "Data Scientist" / "TotalJobs"
+    totals_dir.mkdir(parents=True)
+    pd.DataFrame({
+        'City': ['Ottawa', 'Toronto', 'Ottawa', 'Toronto', 'Montreal'],
+        '24h_Jobs': [1, 2, 3, 4, 5],
+        'Week_Jobs': [1, 2, 3, 4, 5],
+        'Month_Jobs': [1, 2, 3, 4, 5],
+        'Total_Jobs': [10, 20, 15, 18, 7],
+        'Date': ['2024-01-01', '2024-01-01', '2024-01-02', '2024-01-02', '2024-01-02']
+    }).to_csv(totals_dir / "TotalJobs.csv", index=False)
+    
+    df = find_latest_jobs_cities("Data Scientist", "Total", tmp_path)
+    
+    assert df['City'].tolist() == ['Montreal', 'Ottawa', 'Toronto']
+    assert df['Total_Jobs'].tolist() == [7, 15, 18]
+    assert df['delta'].tolist() == [0, 5, -2]
+
+
+_JOB_DETAILS_HTML = """
+<html><head><meta name="description" content="Posted 10:00:00 AM. Build things."></head><body>
+<span class="description__job-criteria-text description__job-criteria-text--criteria">Entry level</span>
+<span class="description__job-criteria-text description__job-criteria-text--criteria">Full-time</span>
+<span class="description__job-criteria-text description__job-criteria-text--criteria">Engineering</span>
+<span class="description__job-criteria-text description__job-criteria-text--criteria">Software Development</span>
+<a class="topcard__org-name-link topcard__flavor--black-link"
+   data-tracking-control-name="public_jobs_topcard-org-name"
+   href="https://www.linkedin.com/company/acme">Acme</a>
+<div class="show-more-less-html__markup show-more-less-html__markup--clamp-after-5 relative overflow-hidden"><p>Line one</p><p>Line two</p></div>
+</body></html>
+"""
+
+
+class _FakeResponse:
+    """Minimal stand-in for requests.Response."""
+    
+    def __init__(self, text, status_code=200, headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+
+class _StubRequestHandler:
+    """Request handler serving canned pages and recording requested URLs."""
+    
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = []
+    
+    def get(self, url, headers=None):
+        self.requested.append(url)
+        return _FakeResponse(self.pages[url]) if url in self.pages else None
+
+
+def test_make_request_retries_until_success(monkeypatch):
+    """Test failed responses and connection errors are retried, up to max_retries."""
+    import requests
+    
+    monkeypatch.setattr("src.linkedin_scraper.utils.request_handler.time.sleep", lambda seconds: None)
+    outcomes = [requests.ConnectionError("reset"), _FakeResponse("busy"), _FakeResponse("ok")]
+    outcomes[1].status_code = 429
+    
+    def request(method, url, **kwargs):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+    
+    handler = RequestHandler(max_retries=2)
+    handler.session.request = request
+    assert handler.get("https://linkedin.com").text == "ok"
+    
+    outcomes[:] = [_FakeResponse("down"), _FakeResponse("down")]
+    for outcome in outcomes:
+        outcome.status_code = 500
+    
+    handler = RequestHandler(max_retries=1)
+    handler.session.request = request
+    assert handler.get("https://linkedin.com") is None
+    assert outcomes == []
+
+
+def test_make_request_revalidates_cached_pages():
+    """Test a repeat GET sends the ETag and serves the cached body as a 200 on 304."""
+    import requests
+    
+    not_modified = requests.Response()
+    not_modified.status_code = 304
+    not_modified._content = b""
+    sent_headers = []
+    outcomes = [_FakeResponse("page", headers={'ETag': '"v1"'}), not_modified]
+    
+    def request(method, url, headers=None, **kwargs):
+        sent_headers.append(headers or {})
+        return outcomes.pop(0)
+    
+    handler = RequestHandler()
+    handler.session.request = request
+    
+    assert handler.get("https://linkedin.com/company/acme").text == "page"
+    revalidated = handler.get("https://linkedin.com/company/acme")
+    assert revalidated.status_code == 200
+    assert revalidated.text == "page"
+    assert 'If-None-Match' not in sent_headers[0]
+    assert sent_headers[1]['If-None-Match'] == '"v1"'
+    assert handler._validated[("https://linkedin.com/company/acme", ())] == ('"v1"', None, "page")
+    
+    # Per-call headers such as cookies get their own cache entry
+    outcomes.append(_FakeResponse("other page"))
+    assert handler.get("https://linkedin.com/company/acme", {'Cookie': 'a=1'}).text == "other page"
+    assert 'If-None-Match' not in sent_headers[2]
+
+
+def test_token_bucket_caps_rate_across_threads():
+    """Test threads sharing a bucket are paced to its rate and paused by hold."""
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    
+    bucket = TokenBucket(rate=20, capacity=1)
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(lambda _: bucket.acquire(), range(5)))
+    
+    # The first token is available at once, the other four come 1/20 s apart
+    assert time.monotonic() - start >= 0.18
+    
+    bucket.hold(0.1)
+    start = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - start >= 0.09
+
+
+def test_scrape_all_job_details_keeps_row_order(tmp_path):
+    """Test job details are added in row order and rows without a URL are skipped."""
+    handler = _StubRequestHandler({
+        "https://linkedin.com/jobs/1": _JOB_DETAILS_HTML,
+        "https://linkedin.com/jobs/3": _JOB_DETAILS_HTML
+    })
+    scraper = LinkedInScraper(tmp_path, handler)
+    
+    file_path = tmp_path / "jobs.csv"
+    pd.DataFrame({
+        'title': ['First', 'Second', 'Third'],
+        'company': ['Acme', 'Acme', 'Acme'],
+        'location': ['Ottawa', 'Ottawa', 'Ottawa'],
+        'date_posted': ['1 day ago', '2 days ago', '3 days ago'],
+        'job_link': ["https://linkedin.com/jobs/1", None, "https://linkedin.com/jobs/3"]
+    }).to_csv(file_path, index=False)
+    
+    df, details_path = scraper.scrape_all_job_details(str(file_path))
+    
+    assert df['title'].tolist() == ['First', 'Third']
+    assert df['seniority_level'].tolist() == ['Entry level', 'Entry level']
+    assert df['industries'].tolist() == ['Software Development', 'Software Development']
+    assert df['company_url'].tolist() == ["https://www.linkedin.com/company/acme"] * 2
+    assert df['description'].tolist() == ['Line oneLine two'] * 2
+    assert df['time_posted'].tolist() == ['10:00:00 AM'] * 2
+    assert sorted(handler.requested) == ["https://linkedin.com/jobs/1", "https://linkedin.com/jobs/3"]
+    
+    # The Parquet copy is stamped with the CSV it was written alongside
+    assert fresh_parquet_copy(Path(details_path)) == Path(details_path).with_suffix('.parquet')
+
+
+def test_scrape_all_company_details_adds_company_columns(tmp_path):
+    """Test each company is fetched once and joined onto its rows under the JobPosting column names."""
+    company_html = (
+        '<div class="mb-2 flex papabear:mr-3 mamabear:mr-3 babybear:flex-wrap"><dt>Type</dt><dd>Privately Held</dd></div>'
+        '<div class="mb-2 flex papabear:mr-3 mamabear:mr-3 babybear:flex-wrap"><dt>Founded</dt><dd>2010</dd></div>'
+    )
+    handler = _StubRequestHandler({"https://linkedin.com/company/acme": company_html})
+    scraper = LinkedInScraper(tmp_path, handler)
+    
+    file_path = tmp_path / "jobs.csv"
+    pd.DataFrame({
+        'title': ['First', 'Second', 'Third', 'Fourth'],
+        'description': ['One', 'Two', 'Three', 'Four'],
+        'company_url': [
+            "https://linkedin.com/company/acme", None,
+            "https://linkedin.com/company/gone", "https://linkedin.com/company/acme"
+        ]
+    }).to_csv(file_path, index=False)
+    
+    df, _ = scraper.scrape_all_company_details(str(file_path))
+    
+    assert list(df.columns) == list(JobPosting.COLUMNS)
+    assert df['title'].tolist() == ['First', 'Fourth']
+    assert df['description'].tolist() == ['One', 'Four']
+    assert df['company_type'].tolist() == ['Privately Held'] * 2
+    assert df['founded'].tolist() == ['2010'] * 2
+    assert sorted(handler.requested) == ["https://linkedin.com/company/acme", "https://linkedin.com/company/gone"]
+
+
+def test_scrape_all_jobs_stops_at_first_empty_page(tmp_path):
+    """Test pages are fetched concurrently but kept in order up to the first empty one."""
+    scraper = LinkedInScraper(tmp_path, _StubRequestHandler({}))
+    requested = []
+    
+    def get_job_list(job_title, location, position=0):
+        requested.append(position)
+        if position >= 100:
+            return pd.DataFrame(columns=['title', 'job_link'])
+        return pd.DataFrame({'title': [f"Job {position}"], 'job_link': [f"https://linkedin.com/jobs/{position}"]})
+    
+    scraper.job_list_scraper.get_first_page_and_total = lambda job_title, location: (
+        [1000, 0, 0, 0], get_job_list(job_title, location)
+    )
+    scraper.job_list_scraper.get_job_list = get_job_list
+    
+    jobs_df, file_path = scraper.scrape_all_jobs("Software Engineer", "Ottawa", limit=1000)
+    
+    assert jobs_df['title'].tolist() == ["Job 0", "Job 60", "Job 70", "Job 80", "Job 90"]
+    assert max(requested) < 160
+    assert pd.read_csv(file_path)['title'].tolist() == jobs_df['title'].tolist()
+
+
+_JOB_CARD_HTML = """
+<div class="base-card relative w-full hover:no-underline focus:no-underline base-card--link base-search-card base-search-card--link job-search-card">
+  <a class="base-card__full-link absolute top-0 right-0 bottom-0 left-0 p-0 z-[2]" href="https://linkedin.com/jobs/{n}"></a>
+  <div class="base-search-card__info">
+    <h3 class="base-search-card__title"> Engineer {n} </h3>
+    <h4><a class="hidden-nested-link">Company {n}</a></h4>
+    <span class="job-search-card__location">Ottawa, ON</span>
+    <time class="job-search-card__listdate">{n} days ago</time>
+  </div>
+</div>
+"""
+
+
+def test_parse_jobs():
+    """Test job cards are parsed into one row per posting."""
+    scraper = JobListScraper(_StubRequestHandler({}))
+    html = "<ul>" + "".join(_JOB_CARD_HTML.format(n=n) for n in (1, 2)) + "</ul>"
+    
+    df = scraper._parse_jobs(html)
+    
+    assert df['title'].tolist() == ['Engineer 1', 'Engineer 2']
+    assert df['company'].tolist() == ['Company 1', 'Company 2']
+    assert df['location'].tolist() == ['Ottawa, ON', 'Ottawa, ON']
+    assert df['date_posted'].tolist() == ['1 days ago', '2 days ago']
+    assert df['job_link'].tolist() == ["https://linkedin.com/jobs/1", "https://linkedin.com/jobs/2"]
+    
+    empty = scraper._parse_jobs("<ul></ul>")
+    assert empty.empty
+    assert list(empty.columns) == list(df.columns)
+
+
+def test_parse_total_jobs():
+    """Test the four job counters are read from the date filter labels."""
+    scraper = JobListScraper(_StubRequestHandler({}))
+    html = """
+    <label for="f_TPR-0">Any time (812)</label>
+    <label for="f_TPR-1">Past month (400)</label>
+    <label for="f_TPR-2">Past week (95)</label>
+    <label for="f_TPR-3">Past 24 hours (12)</label>
+    """
+    
+    assert scraper._parse_total_jobs(html) == [812, 400, 95, 12]
+    assert scraper._parse_total_jobs("<html></html>") == [0, 0, 0, 0]
+
+
+def test_get_first_page_and_total_uses_one_request():
+    """Test the counts and the first page of jobs come from a single fetch."""
+    scraper = JobListScraper(None)
+    url = scraper._build_search_url("Software Engineer", "Ottawa")
+    scraper.request_handler = _StubRequestHandler({
+        url: '<label for="f_TPR-0">Any time (812)</label>' + _JOB_CARD_HTML.format(n=1)
+    })
+    
+    counts, jobs_df = scraper.get_first_page_and_total("Software Engineer", "Ottawa")
+    
+    assert counts == [812, 0, 0, 0]
+    assert jobs_df['title'].tolist() == ['Engineer 1']
+    assert scraper.request_handler.requested == [url]
+
+
+def test_parse_company_details():
+    """Test company facts are read from the definition list."""
+    scraper = CompanyDetailsScraper(_StubRequestHandler({}))
+    html = """
+    <div class="mb-2 flex papabear:mr-3 mamabear:mr-3 babybear:flex-wrap"><dt>Company size</dt><dd> 11-50 employees </dd></div>
+    <div class="mb-2 flex papabear:mr-3 mamabear:mr-3 babybear:flex-wrap"><dt>Founded</dt><dd>2010</dd></div>
+    """
+    
+    details = scraper._parse_response(html)
+    
+    assert details == {'company_size': '11-50 employees', 'founded': '2010'}
+
+
+def test_company_details_are_cached_by_url():
+    """Test each company page is fetched once and failures are not cached."""
+    url = "https://linkedin.com/company/acme"
+    handler = _StubRequestHandler({
+        url: '<div class="mb-2 flex papabear:mr-3 mamabear:mr-3 babybear:flex-wrap"><dt>Founded</dt><dd>2010</dd></div>'
+    })
+    scraper = CompanyDetailsScraper(handler)
+    
+    assert scraper.get_company_details(url) == {'founded': '2010'}
+    assert scraper.get_company_details(url) == {'founded': '2010'}
+    assert scraper.get_company_details("https://linkedin.com/company/missing") is None
+    assert scraper.get_company_details("https://linkedin.com/company/missing") is None
+    
+    assert handler.requested == [url] + ["https://linkedin.com/company/missing"] * 2
 
 
 if __name__ == "__main__":